@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import heapq
 import logging
 import math
-from dataclasses import asdict
+import time
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any, Literal
 
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -24,7 +26,6 @@ from api.v1.application.utils.pagination import (
     calculate_offset,
     validate_pagination_params,
 )
-from api.v1.domain.open_data.entities import UnifiedDataItem
 from models import (
     GeneratedAPIDocs,
     GeneratedFileDocs,
@@ -36,6 +37,16 @@ from models import (
     RankTrending,
 )
 
+_request_cnt = itemgetter("request_cnt")
+
+# 통합 목록 전체 개수 캐시 (만료 시각, 개수)
+_UNIFIED_TOTAL_TTL = 60.0
+_unified_total_cache: tuple[float, int] | None = None
+
+# 컬렉션 통계 캐시 (만료 시각, 통계)
+_STATS_TTL = 60.0
+_stats_cache: tuple[float, dict[str, Any]] | None = None
+
 
 class CatalogService:
     def __init__(
@@ -55,18 +66,21 @@ class CatalogService:
         offset = calculate_offset(page, size)
 
         list_ids = await self._get_search_list_ids(query, size, search_service)
-        api_data = await self._get_api_data(list_ids)
-        file_data = await self._get_file_data(list_ids)
+        api_data, file_data = await asyncio.gather(
+            self._get_api_data(list_ids), self._get_file_data(list_ids)
+        )
 
         all_data = api_data + file_data
-        all_data.sort(key=lambda x: x.request_cnt, reverse=True)
-
-        start_idx = offset
-        end_idx = start_idx + size
-        paginated_data = all_data[start_idx:end_idx]
+        end_idx = offset + size
+        if end_idx * 2 <= len(all_data):
+            # 앞쪽 페이지는 전체 정렬 없이 상위 end_idx개만 선택
+            top_data = heapq.nlargest(end_idx, all_data, key=_request_cnt)
+        else:
+            top_data = sorted(all_data, key=_request_cnt, reverse=True)
+        paginated_data = top_data[offset:end_idx]
 
         return {
-            "data": [asdict(item) for item in paginated_data],
+            "data": paginated_data,
             "total": len(all_data),
             "page": page,
             "size": size,
@@ -78,110 +92,168 @@ class CatalogService:
         if not search_service:
             return []
         search_size = max(size * 3, 10)
-        hits = search_service.search_titles(
+        hits = await search_service.search_titles(
             query=query, size=search_size, from_=0
         )
-        return [hit["_source"].get("list_id") for hit in hits["hits"]]
+        return [hit.get("list_id") for hit in hits["items"]]
 
-    async def _get_api_data(self, list_ids: list[str]) -> list[UnifiedDataItem]:
+    async def _get_api_data(self, list_ids: list[str]) -> list[dict[str, Any]]:
         if not list_ids:
             return []
         api_list_ids = self._convert_to_int_list_ids(list_ids)
         if not api_list_ids:
             return []
-        api_docs = await OpenAPIInfo.find(
-            {"list_id": {"$in": api_list_ids}}
-        ).to_list()
-
-        api_data: list[UnifiedDataItem] = []
-        for doc in api_docs:
-            generated_doc = await GeneratedAPIDocs.find_one(
-                {"list_id": doc.list_id}
-            )
-            item = UnifiedDataItem(
-                list_id=doc.list_id,
-                title=doc.list_title,
-                description=doc.desc,
-                department=doc.dept_nm or "",
-                category=doc.category_nm,
-                data_type="API",
-                data_format=doc.data_format,
-                pricing=doc.is_charged,
-                copyright=doc.is_copyrighted,
-                third_party_copyright=doc.is_third_party_copyrighted,
-                keywords=(
-                    doc.keywords if isinstance(doc.keywords, list) else []
-                ),
-                register_status=doc.register_status or "",
-                request_cnt=doc.request_cnt,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at,
-                use_prmisn_ennc=doc.use_prmisn_ennc,
-                title_en=doc.title_en,
-                api_type=doc.api_type,
-                endpoints=None,
-                has_generated_doc=generated_doc is not None,
-                token_count=generated_doc.token_count if generated_doc else 0,
-                score=None,
+        cursor = self.open_data_db.open_data_info.aggregate(
+            self._build_search_join_pipeline(
+                api_list_ids,
+                "generated_api_docs",
+                {
+                    "list_id": 1,
+                    "list_title": 1,
+                    "desc": 1,
+                    "dept_nm": 1,
+                    "category_nm": 1,
+                    "data_format": 1,
+                    "is_charged": 1,
+                    "is_copyrighted": 1,
+                    "is_third_party_copyrighted": 1,
+                    "keywords": 1,
+                    "register_status": 1,
+                    "request_cnt": {"$toInt": "$request_cnt"},
+                    "created_at": 1,
+                    "updated_at": 1,
+                    "use_prmisn_ennc": 1,
+                    "title_en": 1,
+                    "api_type": 1,
+                },
             )
+        )
+
+        api_data: list[dict[str, Any]] = []
+        async for doc in cursor:
+            keywords = doc.get("keywords")
+            item = {
+                "list_id": doc["list_id"],
+                "title": doc.get("list_title"),
+                "description": doc.get("desc"),
+                "department": doc.get("dept_nm") or "",
+                "category": doc.get("category_nm"),
+                "data_type": "API",
+                "data_format": doc.get("data_format"),
+                "pricing": doc.get("is_charged"),
+                "copyright": doc.get("is_copyrighted"),
+                "third_party_copyright": doc.get("is_third_party_copyrighted"),
+                "keywords": keywords if isinstance(keywords, list) else [],
+                "register_status": doc.get("register_status") or "",
+                "request_cnt": doc.get("request_cnt") or 0,
+                "created_at": doc.get("created_at"),
+                "updated_at": doc.get("updated_at"),
+                "use_prmisn_ennc": doc.get("use_prmisn_ennc"),
+                "title_en": doc.get("title_en"),
+                "api_type": doc.get("api_type"),
+                "endpoints": None,
+                "has_generated_doc": doc["has_generated_doc"],
+                "token_count": doc["token_count"],
+                "score": None,
+            }
             api_data.append(item)
         return api_data
 
     async def _get_file_data(
         self, list_ids: list[str]
-    ) -> list[UnifiedDataItem]:
+    ) -> list[dict[str, Any]]:
         if not list_ids:
             return []
-        file_docs = await OpenFileInfo.find(
-            {"list_id": {"$in": list_ids}}
-        ).to_list()
-
-        file_data: list[UnifiedDataItem] = []
-        for doc in file_docs:
-            generated_doc = await GeneratedFileDocs.find_one(
-                {"list_id": doc.list_id}
+        cursor = self.open_data_db.open_file_info.aggregate(
+            self._build_search_join_pipeline(
+                list_ids,
+                "generated_file_docs",
+                {
+                    "list_id": 1,
+                    "list_title": 1,
+                    "title": 1,
+                    "desc": 1,
+                    "org_nm": 1,
+                    "dept_nm": 1,
+                    "new_category_nm": 1,
+                    "data_type": 1,
+                    "is_charged": 1,
+                    "is_copyrighted": 1,
+                    "is_third_party_copyrighted": 1,
+                    "keywords": 1,
+                    "register_status": 1,
+                    "download_cnt": {"$toInt": "$download_cnt"},
+                    "created_at": 1,
+                    "updated_at": 1,
+                    "ownership_grounds": 1,
+                },
             )
-            item = UnifiedDataItem(
-                list_id=int(doc.list_id) if doc.list_id else 0,
-                title=doc.list_title or doc.title or "",
-                description=doc.desc or "",
-                department=doc.org_nm or doc.dept_nm or "",
-                category=doc.new_category_nm or "",
-                data_type="FILE",
-                data_format=doc.data_type or "",
-                pricing=doc.is_charged,
-                copyright=doc.is_copyrighted,
-                third_party_copyright=(doc.is_third_party_copyrighted or ""),
-                keywords=(
-                    doc.keywords if isinstance(doc.keywords, list) else []
+        )
+
+        file_data: list[dict[str, Any]] = []
+        async for doc in cursor:
+            keywords = doc.get("keywords")
+            list_id = doc.get("list_id")
+            item = {
+                "list_id": int(list_id) if list_id else 0,
+                "title": doc.get("list_title") or doc.get("title") or "",
+                "description": doc.get("desc") or "",
+                "department": doc.get("org_nm") or doc.get("dept_nm") or "",
+                "category": doc.get("new_category_nm") or "",
+                "data_type": "FILE",
+                "data_format": doc.get("data_type") or "",
+                "pricing": doc.get("is_charged"),
+                "copyright": doc.get("is_copyrighted"),
+                "third_party_copyright": (
+                    doc.get("is_third_party_copyrighted") or ""
                 ),
-                register_status=doc.register_status or "",
-                request_cnt=doc.download_cnt or 0,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at,
-                use_prmisn_ennc=doc.ownership_grounds or "",
-                title_en=None,
-                api_type="FILE",
-                endpoints=None,
-                has_generated_doc=generated_doc is not None,
-                token_count=generated_doc.token_count if generated_doc else 0,
-                score=None,
-            )
+                "keywords": keywords if isinstance(keywords, list) else [],
+                "register_status": doc.get("register_status") or "",
+                "request_cnt": doc.get("download_cnt") or 0,
+                "created_at": doc.get("created_at"),
+                "updated_at": doc.get("updated_at"),
+                "use_prmisn_ennc": doc.get("ownership_grounds") or "",
+                "title_en": None,
+                "api_type": "FILE",
+                "endpoints": None,
+                "has_generated_doc": doc["has_generated_doc"],
+                "token_count": doc["token_count"],
+                "score": None,
+            }
             file_data.append(item)
         return file_data
 
+    def _build_search_join_pipeline(
+        self,
+        list_ids: list,
+        generated_collection: str,
+        projection: dict[str, Any],
+    ) -> list[dict]:
+        return [
+            {"$match": {"list_id": {"$in": list_ids}}},
+            *self._build_generated_lookup(
+                generated_collection, "generated_doc"
+            ),
+            {
+                "$project": {
+                    **projection,
+                    "_id": 0,
+                    "has_generated_doc": {
+                        "$eq": [{"$type": "$generated_doc"}, "object"]
+                    },
+                    "token_count": {
+                        "$ifNull": ["$generated_doc.token_count", 0]
+                    },
+                }
+            },
+        ]
+
     def _convert_to_int_list_ids(self, list_ids: list[str]) -> list[int]:
-        api_list_ids: list[int] = []
-        for lid in list_ids:
-            try:
-                if isinstance(lid, str):
-                    if lid.isdigit():
-                        api_list_ids.append(int(lid))
-                elif isinstance(lid, int):
-                    api_list_ids.append(lid)
-            except (ValueError, AttributeError):
-                continue
-        return api_list_ids
+        return [
+            lid if isinstance(lid, int) else int(lid)
+            for lid in list_ids
+            if isinstance(lid, int) or (isinstance(lid, str) and lid.isdigit())
+        ]
 
     async def get_unified_data_paginated(
         self,
@@ -195,49 +267,62 @@ class CatalogService:
         status_sort_by: str = "all",
     ) -> dict[str, Any]:
         self.logger.info(
-            f"[CatalogService] 데이터 조회 시작: page={page}, size={size}"
+            "[CatalogService] 데이터 조회 시작: page=%s, size=%s", page, size
         )
         page, size = validate_pagination_params(page, size)
         offset = calculate_offset(page, size)
 
-        api_pipeline = self._build_api_pipeline({})
-        file_pipeline = self._build_file_pipeline({}, sort_by)
+        sort_stage = (
+            {"request_cnt": -1, "_source": 1, "list_id": 1}
+            if sort_by == "popular"
+            else {"updated_at": -1, "_source": 1, "list_id": 1}
+        )
+        file_pipeline = self._build_file_pipeline({}, sort_by) + [
+            {
+                "$addFields": {
+                    "request_cnt": {"$ifNull": ["$download_cnt", 0]},
+                    "_source": 1,
+                }
+            }
+        ]
+        pipeline = self._build_api_pipeline({}) + [
+            {
+                "$addFields": {
+                    "request_cnt": {"$ifNull": ["$request_cnt", 0]},
+                    "_source": 0,
+                }
+            },
+            {
+                "$unionWith": {
+                    "coll": "open_file_info",
+                    "pipeline": file_pipeline,
+                }
+            },
+            # list_id 중복은 API 문서를 우선으로 하나만 남김
+            {"$sort": {"_source": 1}},
+            {"$group": {"_id": "$list_id", "doc": {"$first": "$$ROOT"}}},
+            {"$replaceRoot": {"newRoot": "$doc"}},
+            {"$sort": sort_stage},
+            {"$skip": offset},
+            {"$limit": size},
+            # 정렬 키에 생성 문서 정보가 없으므로 페이지 행에만 조인
+            *self._build_generated_join_stages(),
+        ]
 
         self.logger.info("[CatalogService] MongoDB Aggregation 실행 시작")
 
-        api_result, file_result = await asyncio.gather(
-            self.open_data_db.open_data_info.aggregate(api_pipeline).to_list(),
-            self.open_data_db.open_file_info.aggregate(file_pipeline).to_list(),
+        paginated_data, total_count = await asyncio.gather(
+            # 한 페이지가 첫 배치에 모두 담기도록 batchSize를 맞춤
+            self.open_data_db.open_data_info.aggregate(
+                pipeline, allowDiskUse=True, batchSize=size
+            ).to_list(length=size),
+            self._get_unified_total(),
         )
 
-        api_data = api_result if api_result else []
-        file_data = file_result if file_result else []
-
-        for item in api_data:
-            item["request_cnt"] = item.get("request_cnt", 0)
-        for item in file_data:
-            item["request_cnt"] = item.get("download_cnt", 0)
-
-        unique_data = self._merge_and_deduplicate_data(api_data, file_data)
-
-        if sort_by == "popular":
-            unique_data.sort(
-                key=lambda x: x.get("request_cnt", 0), reverse=True
-            )
-        else:
-            unique_data.sort(
-                key=lambda x: x.get("updated_at") or datetime.min, reverse=True
-            )
-
-        start_idx = offset
-        end_idx = start_idx + size
-        paginated_data = unique_data[start_idx:end_idx]
-
-        total_count = len(unique_data)
-
         self.logger.info(
-            f"[CatalogService] 조회 완료: API={len(api_data)}개, "
-            f"File={len(file_data)}개, 총 {len(paginated_data)}개 반환"
+            "[CatalogService] 조회 완료: 총 %d개 중 %d개 반환",
+            total_count,
+            len(paginated_data),
         )
 
         return {
@@ -247,11 +332,36 @@ class CatalogService:
             "size": size,
         }
 
+    async def _get_unified_total(self) -> int:
+        """API + File 고유 list_id 수 (필터가 없으므로 TTL 동안 재사용)"""
+        global _unified_total_cache
+
+        now = time.monotonic()
+        if _unified_total_cache and _unified_total_cache[0] > now:
+            return _unified_total_cache[1]
+
+        # 개수만 필요하므로 $lookup 없이 list_id만 합쳐서 센다
+        result = await self.open_data_db.open_data_info.aggregate(
+            [
+                {"$project": {"_id": 0, "list_id": 1}},
+                {
+                    "$unionWith": {
+                        "coll": "open_file_info",
+                        "pipeline": [{"$project": {"_id": 0, "list_id": 1}}],
+                    }
+                },
+                {"$group": {"_id": "$list_id"}},
+                {"$count": "count"},
+            ],
+            allowDiskUse=True,
+        ).to_list(length=1)
+        total = result[0]["count"] if result else 0
+
+        _unified_total_cache = (now + _UNIFIED_TOTAL_TTL, total)
+        return total
+
     async def rebuild_rank_snapshots(self) -> dict[str, int]:
         now = datetime.now(timezone.utc)
-        api_docs = await OpenAPIInfo.find({}, projection_model=None).to_list()
-        file_docs = await OpenFileInfo.find({}, projection_model=None).to_list()
-
         rows: list[dict[str, Any]] = []
 
         api_generated_map: dict[int, GeneratedAPIDocs] = {}
@@ -259,7 +369,7 @@ class CatalogService:
         for g in api_generated_list:
             api_generated_map[g.list_id] = g
 
-        for doc in api_docs:
+        async for doc in OpenAPIInfo.find({}):
             gen = api_generated_map.get(doc.list_id)
             rows.append(
                 {
@@ -280,7 +390,7 @@ class CatalogService:
         for g in file_generated_list:
             file_generated_map[g.list_id] = g
 
-        for doc in file_docs:
+        async for doc in OpenFileInfo.find({}):
             gen = file_generated_map.get(int(doc.list_id) if doc.list_id else 0)
             rows.append(
                 {
@@ -337,14 +447,9 @@ class CatalogService:
             RankTrending, trending_sorted[:1000], score_field="trending_score"
         )
 
-        seen_list_ids = set()
-        unique_rows = []
-        for row in rows:
-            list_id = row.get("list_id")
-            if list_id and list_id not in seen_list_ids:
-                seen_list_ids.add(list_id)
-                unique_rows.append(row)
-        total_count = len(unique_rows)
+        total_count = len(
+            {row["list_id"] for row in rows if row.get("list_id")}
+        )
         now_utc = datetime.now(datetime.now().astimezone().tzinfo)
 
         for sort_type in ["latest", "popular", "trending"]:
@@ -477,14 +582,6 @@ class CatalogService:
         self, sort_conditions: dict[str, int]
     ) -> list[dict]:
         pipeline = [
-            {
-                "$lookup": {
-                    "from": "generated_api_docs",
-                    "localField": "list_id",
-                    "foreignField": "list_id",
-                    "as": "generated_docs",
-                }
-            },
             {
                 "$project": {
                     "list_id": 1,
@@ -492,25 +589,6 @@ class CatalogService:
                     "org_nm": 1,
                     "request_cnt": {"$toInt": "$request_cnt"},
                     "updated_at": 1,
-                    "token_count": {
-                        "$cond": [
-                            {"$gt": [{"$size": "$generated_docs"}, 0]},
-                            {
-                                "$arrayElemAt": [
-                                    "$generated_docs.token_count",
-                                    0,
-                                ]
-                            },
-                            0,
-                        ]
-                    },
-                    "has_generated_doc": {
-                        "$cond": [
-                            {"$gt": [{"$size": "$generated_docs"}, 0]},
-                            True,
-                            False,
-                        ]
-                    },
                     "data_type": {"$literal": "API"},
                 }
             },
@@ -523,14 +601,6 @@ class CatalogService:
         self, sort_conditions: dict[str, int], sort_by: str
     ) -> list[dict]:
         pipeline = [
-            {
-                "$lookup": {
-                    "from": "generated_file_docs",
-                    "localField": "list_id",
-                    "foreignField": "list_id",
-                    "as": "generated_docs",
-                }
-            },
             {
                 "$project": {
                     "list_id": 1,
@@ -538,25 +608,6 @@ class CatalogService:
                     "org_nm": {"$ifNull": ["$org_nm", "$dept_nm"]},
                     "download_cnt": {"$toInt": "$download_cnt"},
                     "updated_at": 1,
-                    "token_count": {
-                        "$cond": [
-                            {"$gt": [{"$size": "$generated_docs"}, 0]},
-                            {
-                                "$arrayElemAt": [
-                                    "$generated_docs.token_count",
-                                    0,
-                                ]
-                            },
-                            0,
-                        ]
-                    },
-                    "has_generated_doc": {
-                        "$cond": [
-                            {"$gt": [{"$size": "$generated_docs"}, 0]},
-                            True,
-                            False,
-                        ]
-                    },
                     "data_type": {"$literal": "FILE"},
                 }
             },
@@ -570,27 +621,99 @@ class CatalogService:
             pipeline.append({"$sort": file_sort_conditions})
         return pipeline
 
-    def _merge_and_deduplicate_data(
-        self, api_data: list, file_data: list
-    ) -> list:
-        all_data = api_data + file_data
-        seen_ids = set()
-        unique_data = []
-        for item in all_data:
-            list_id = item.get("list_id")
-            if list_id not in seen_ids:
-                seen_ids.add(list_id)
-                unique_data.append(item)
-        return unique_data
+    def _build_generated_lookup(
+        self, generated_collection: str, as_field: str
+    ) -> list[dict]:
+        # 배열을 만들지 않도록 token_count 한 건만 조회해 바로 unwind
+        return [
+            {
+                "$lookup": {
+                    "from": generated_collection,
+                    "let": {"list_id": "$list_id"},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "$expr": {"$eq": ["$list_id", "$$list_id"]}
+                            }
+                        },
+                        {"$project": {"_id": 0, "token_count": 1}},
+                        {"$limit": 1},
+                    ],
+                    "as": as_field,
+                }
+            },
+            {
+                "$unwind": {
+                    "path": f"${as_field}",
+                    "preserveNullAndEmptyArrays": True,
+                }
+            },
+        ]
+
+    def _build_generated_join_stages(self) -> list[dict]:
+        return [
+            *self._build_generated_lookup(
+                "generated_api_docs", "generated_api"
+            ),
+            *self._build_generated_lookup(
+                "generated_file_docs", "generated_file"
+            ),
+            {
+                "$addFields": {
+                    "generated_doc": {
+                        "$cond": [
+                            {"$eq": ["$_source", 0]},
+                            "$generated_api",
+                            "$generated_file",
+                        ]
+                    }
+                }
+            },
+            {
+                "$addFields": {
+                    "token_count": {
+                        "$ifNull": ["$generated_doc.token_count", 0]
+                    },
+                    "has_generated_doc": {
+                        "$eq": [{"$type": "$generated_doc"}, "object"]
+                    },
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "_source": 0,
+                    "generated_doc": 0,
+                    "generated_api": 0,
+                    "generated_file": 0,
+                }
+            },
+        ]
 
     async def get_cross_collection_stats(self) -> dict[str, Any]:
-        total_api_data = await OpenAPIInfo.count()
-        total_api_docs = await GeneratedAPIDocs.count()
-        total_file_data = await OpenFileInfo.count()
-        total_file_docs = await GeneratedFileDocs.count()
+        """컬렉션별 개수와 문서 생성 비율 (근사값이므로 TTL 동안 재사용)"""
+        global _stats_cache
+
+        now = time.monotonic()
+        if _stats_cache and _stats_cache[0] > now:
+            return dict(_stats_cache[1])
+
+        # 필터 없는 전체 개수라 컬렉션 메타데이터 기반 추정치로 충분
+        db = self.open_data_db
+        (
+            total_api_data,
+            total_api_docs,
+            total_file_data,
+            total_file_docs,
+        ) = await asyncio.gather(
+            db.open_data_info.estimated_document_count(),
+            db.generated_api_docs.estimated_document_count(),
+            db.open_file_info.estimated_document_count(),
+            db.generated_file_docs.estimated_document_count(),
+        )
         total_open_data = total_api_data + total_file_data
         total_generated_docs = total_api_docs + total_file_docs
-        return {
+        stats = {
             "total_open_data": total_open_data,
             "total_generated_docs": total_generated_docs,
             "api_data_count": total_api_data,
@@ -607,3 +730,6 @@ class CatalogService:
             if total_open_data > 0
             else 0,
         }
+
+        _stats_cache = (now + _STATS_TTL, stats)
+        return dict(stats)
@@ -13,7 +13,7 @@
 # limitations under the License.
 from typing import Any
 
-from beanie.operators import Eq, In
+from beanie.operators import Eq
 
 from api.v1.application.open_data.dto import SuccessRateDTO
 from models import (
@@ -25,6 +25,17 @@ from models import (
 )
 from utils.datetime_util import now_kst
 
+# model_dump()와 같은 키 구성을 유지하기 위한 선택 필드 기본값
+_GENERATED_DOC_DEFAULTS: dict[str, dict[str, Any]] = {
+    "API": {"result_json": None, "detail": None, "generated_at": None},
+    "FILE": {
+        "status": None,
+        "result_json": None,
+        "detail": None,
+        "generated_at": None,
+    },
+}
+
 
 class DocumentsAppService:
     async def get_generated_documents(
@@ -34,48 +45,37 @@ class DocumentsAppService:
         page: int,
         page_size: int,
     ) -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
-
-        if list_ids:
-            api_docs = (
-                await GeneratedAPIDocs.find(
-                    In(GeneratedAPIDocs.list_id, list_ids)
-                )
-                .skip((page - 1) * page_size)
-                .limit(page_size)
-                .to_list()
-            )
-        else:
-            api_docs = (
-                await GeneratedAPIDocs.find()
-                .skip((page - 1) * page_size)
-                .limit(page_size)
-                .to_list()
-            )
-
-        for doc in api_docs:
-            results.append({"data_type": "API", **doc.model_dump()})
+        api_docs = await self._find_generated_docs(
+            GeneratedAPIDocs, "API", list_ids, page, page_size
+        )
+        file_docs = await self._find_generated_docs(
+            GeneratedFileDocs, "FILE", list_ids, page, page_size
+        )
+        return api_docs + file_docs
 
-        if list_ids:
-            file_docs = (
-                await GeneratedFileDocs.find(
-                    In(GeneratedFileDocs.list_id, list_ids)
-                )
-                .skip((page - 1) * page_size)
-                .limit(page_size)
-                .to_list()
-            )
-        else:
-            file_docs = (
-                await GeneratedFileDocs.find()
-                .skip((page - 1) * page_size)
-                .limit(page_size)
-                .to_list()
+    async def _find_generated_docs(
+        self,
+        model: type[GeneratedAPIDocs] | type[GeneratedFileDocs],
+        data_type: str,
+        list_ids: list[int] | None,
+        page: int,
+        page_size: int,
+    ) -> list[dict[str, Any]]:
+        # 저장된 문서를 그대로 내보내므로 모델 검증/덤프 없이 원본 dict 사용
+        query = {"list_id": {"$in": list_ids}} if list_ids else {}
+        cursor = (
+            model.get_pymongo_collection()
+            .find(query)
+            .skip((page - 1) * page_size)
+            .limit(page_size)
+        )
+        defaults = _GENERATED_DOC_DEFAULTS[data_type]
+        results: list[dict[str, Any]] = []
+        async for doc in cursor:
+            doc_id = doc.pop("_id")
+            results.append(
+                {"data_type": data_type, "id": str(doc_id), **defaults, **doc}
             )
-
-        for doc in file_docs:
-            results.append({"data_type": "FILE", **doc.model_dump()})
-
         return results
 
     async def get_std_doc_detail(self, *, list_id: int) -> dict[str, Any]:
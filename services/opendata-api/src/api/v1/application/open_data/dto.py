@@ -72,6 +72,54 @@ class PaginatedUnifiedDataDTO(BaseModel):
     has_prev: bool
 
 
+# (필드명, camelCase 키, 기본값, default_factory) - 모듈 로드 시 한 번만 계산
+_UNIFIED_ITEM_FIELDS = tuple(
+    (name, to_camel(name), field.default, field.default_factory)
+    for name, field in UnifiedDataItemDTO.model_fields.items()
+)
+
+
+def _dump_unified_item(item: dict[str, Any]) -> dict[str, Any]:
+    return {
+        alias: item[name]
+        if name in item
+        else (factory() if factory is not None else default)
+        for name, alias, default, factory in _UNIFIED_ITEM_FIELDS
+    }
+
+
+def create_paginated_response(
+    items: list[dict[str, Any]],
+    total: int,
+    page: int,
+    size: int,
+    validate: bool = False,
+) -> dict[str, Any]:
+    """PaginatedUnifiedDataDTO와 같은 camelCase dict를 검증 없이 직접 생성"""
+    total_pages = (total + size - 1) // size if size > 0 else 0
+    if validate:
+        # 목록 전체를 한 번의 pydantic-core 호출로 검증
+        return PaginatedUnifiedDataDTO(
+            items=items,
+            total=total,
+            page=page,
+            size=size,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1,
+        ).model_dump(by_alias=True)
+
+    return {
+        "items": [_dump_unified_item(item) for item in items],
+        "total": total,
+        "page": page,
+        "size": size,
+        "totalPages": total_pages,
+        "hasNext": page < total_pages,
+        "hasPrev": page > 1,
+    }
+
+
 class RecommendationItemDTO(BaseModel):
     model_config = ConfigDict(
         extra="ignore",
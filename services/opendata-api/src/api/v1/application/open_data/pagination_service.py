@@ -113,11 +113,12 @@ class PaginationAppService:
     ) -> PaginatedUnifiedDataDTO:
         """통합 데이터 페이지네이션 조회"""
         result = await self._svc.get_unified_data_paginated(**kwargs)
+        # 내부 aggregation 결과이므로 검증 없이 생성
         items = []
         for item in result.get("data", []):
             if hasattr(item, "__dataclass_fields__"):
                 item = asdict(item)
-            items.append(UnifiedDataItemDTO(**item))
+            items.append(UnifiedDataItemDTO.model_construct(**item))
         total = result.get("total", 0)
         page = result.get("page", 1)
         size = result.get("size", 10)
@@ -125,7 +126,7 @@ class PaginationAppService:
         has_next = page < total_pages
         has_prev = page > 1
 
-        return PaginatedUnifiedDataDTO(
+        return PaginatedUnifiedDataDTO.model_construct(
             items=items,
             total=total,
             page=page,
@@ -15,15 +15,14 @@ from typing import Any
 
 from beanie.operators import In
 
-from api.v1.application.open_data.dto import (
-    SearchStdDocsItemDTO,
-    SearchStdDocsResponseDTO,
-)
+from api.v1.application.open_data.dto import SearchStdDocsResponseDTO
+from core.settings import get_settings
 from models import (
     GeneratedAPIDocs,
     GeneratedFileDocs,
     OpenAPIInfo,
     OpenFileInfo,
+    find_trusted,
 )
 from utils.datetime_util import format_datetime
 
@@ -43,11 +42,11 @@ class SearchAppService:
         from_ = (page - 1) * size
 
         if use_adaptive_filtering:
-            hits = search_service.search_titles_with_adaptive_filtering(
+            hits = await search_service.search_titles_with_adaptive_filtering(
                 query=q.strip(), size=size, from_=from_
             )
         else:
-            hits = search_service.search_titles(
+            hits = await search_service.search_titles(
                 query=q.strip(),
                 size=size,
                 from_=from_,
@@ -56,9 +55,9 @@ class SearchAppService:
             )
 
         list_ids: list[int] = []
-        for hit in hits["hits"]:
+        for hit in hits["items"]:
             try:
-                list_ids.append(int(hit["_source"].get("list_id")))
+                list_ids.append(int(hit.get("list_id")))
             except (ValueError, TypeError):
                 continue
 
@@ -66,9 +65,11 @@ class SearchAppService:
         file_data_info: dict[int, dict[str, Any]] = {}
 
         if list_ids:
-            api_docs = await OpenAPIInfo.find(
-                In(OpenAPIInfo.list_id, list_ids)
-            ).to_list()
+            api_docs = await find_trusted(
+                OpenAPIInfo,
+                {"list_id": {"$in": list_ids}},
+                validate=not get_settings().skip_validation_on_read,
+            )
             for doc in api_docs:
                 api_data_info[doc.list_id] = {
                     "list_title": doc.list_title,
@@ -76,9 +77,11 @@ class SearchAppService:
                     "data_type": "API",
                 }
 
-            file_docs = await OpenFileInfo.find(
-                In(OpenFileInfo.list_id, list_ids)
-            ).to_list()
+            file_docs = await find_trusted(
+                OpenFileInfo,
+                {"list_id": {"$in": list_ids}},
+                validate=not get_settings().skip_validation_on_read,
+            )
             for doc in file_docs:
                 if doc.list_id is not None:
                     file_data_info[doc.list_id] = {
@@ -114,9 +117,8 @@ class SearchAppService:
                 }
 
         items: list[dict[str, Any]] = []
-        for hit in hits["hits"]:
-            source = hit["_source"]
-            list_id = int(source.get("list_id"))
+        for hit in hits["items"]:
+            list_id = int(hit.get("list_id"))
 
             if list_id in api_data_info:
                 api_info = api_data_info[list_id]
@@ -160,11 +162,11 @@ class SearchAppService:
                 gen = file_generated_docs[list_id]
                 org_nm = api_data_info.get(list_id, {}).get(
                     "org_nm"
-                ) or source.get("org_nm")
+                ) or hit.get("org_nm")
                 items.append(
                     {
                         "list_id": list_id,
-                        "list_title": source.get("list_title", ""),
+                        "list_title": hit.get("list_title", ""),
                         "org_nm": org_nm,
                         "token_count": gen["token_count"],
                         "has_generated_doc": gen["has_generated_doc"],
@@ -177,19 +179,19 @@ class SearchAppService:
                 items.append(
                     {
                         "list_id": list_id,
-                        "list_title": source.get("list_title", ""),
+                        "list_title": hit.get("list_title", ""),
                         "org_nm": None,
                         "token_count": 0,
                         "has_generated_doc": False,
                         "updated_at": None,
-                        "data_type": source.get("data_type", "API"),
+                        "data_type": hit.get("data_type", "API"),
                         "score": hit.get("_score"),
                     }
                 )
 
         return {
             "items": items,
-            "total": hits["total"]["value"],
+            "total": hits["total"],
             "page": page,
             "size": size,
         }
@@ -209,13 +211,13 @@ class SearchAppService:
         all_generated_list_ids = set(api_list_ids + file_list_ids)
 
         search_size = max(page_size * 3, 10)
-        hits = search_service.search_titles_with_weights(
+        hits = await search_service.search_titles_with_weights(
             queries=queries, size=search_size, from_=0
         )
 
         filtered_hits = []
-        for hit in hits["hits"]:
-            list_id = hit["_source"].get("list_id")
+        for hit in hits["items"]:
+            list_id = hit.get("list_id")
             list_id_int = int(list_id) if list_id is not None else None
             if list_id_int in all_generated_list_ids:
                 filtered_hits.append(hit)
@@ -228,7 +230,7 @@ class SearchAppService:
 
         list_ids: list[int] = []
         for hit in paginated_hits:
-            list_id = hit["_source"].get("list_id")
+            list_id = hit.get("list_id")
             list_id_int = int(list_id) if list_id is not None else None
             if list_id_int is not None:
                 list_ids.append(list_id_int)
@@ -257,9 +259,11 @@ class SearchAppService:
 
         open_api_info: dict[int, dict[str, Any]] = {}
         if list_ids:
-            open_api_rows = await OpenAPIInfo.find(
-                In(OpenAPIInfo.list_id, list_ids)
-            ).to_list()
+            open_api_rows = await find_trusted(
+                OpenAPIInfo,
+                {"list_id": {"$in": list_ids}},
+                validate=not get_settings().skip_validation_on_read,
+            )
             for doc in open_api_rows:
                 open_api_info[doc.list_id] = {
                     "org_nm": doc.org_nm,
@@ -269,9 +273,11 @@ class SearchAppService:
 
         open_file_info: dict[int, dict[str, Any]] = {}
         if list_ids:
-            open_file_rows = await OpenFileInfo.find(
-                In(OpenFileInfo.list_id, list_ids)
-            ).to_list()
+            open_file_rows = await find_trusted(
+                OpenFileInfo,
+                {"list_id": {"$in": list_ids}},
+                validate=not get_settings().skip_validation_on_read,
+            )
             for doc in open_file_rows:
                 if doc.list_id is not None:
                     open_file_info[doc.list_id] = {
@@ -280,10 +286,9 @@ class SearchAppService:
                         "title": doc.title,
                     }
 
-        results: list[SearchStdDocsItemDTO] = []
+        results: list[dict[str, Any]] = []
         for hit in paginated_hits:
-            source = hit["_source"]
-            list_id = source.get("list_id")
+            list_id = hit.get("list_id")
             list_id_int = int(list_id) if list_id is not None else None
 
             if list_id_int in api_docs:
@@ -293,10 +298,10 @@ class SearchAppService:
                 org_nm = open_api_info.get(list_id_int, {}).get("org_nm")
                 list_title = open_api_info.get(list_id_int, {}).get(
                     "list_title"
-                ) or source.get("list_title", "")
+                ) or hit.get("list_title", "")
                 title = open_api_info.get(list_id_int, {}).get(
                     "title"
-                ) or source.get("title", "")
+                ) or hit.get("title", "")
             elif list_id_int in file_docs:
                 doc_data = file_docs[list_id_int]
                 data_type = doc_data["data_type"]
@@ -304,12 +309,12 @@ class SearchAppService:
                 org_nm = open_file_info.get(list_id_int, {}).get("org_nm")
                 list_title = open_file_info.get(list_id_int, {}).get(
                     "list_title"
-                ) or source.get("list_title", "")
+                ) or hit.get("list_title", "")
                 title = open_file_info.get(list_id_int, {}).get(
                     "title"
-                ) or source.get("title", "")
+                ) or hit.get("title", "")
             else:
-                data_type = source.get("data_type", "API")
+                data_type = hit.get("data_type", "API")
                 detail = None
                 org_nm = (
                     open_api_info.get(list_id_int, {}).get("org_nm")
@@ -320,19 +325,19 @@ class SearchAppService:
                     if list_id_int is not None
                     else None
                 )
-                list_title = source.get("list_title", "")
-                title = source.get("title", "")
+                list_title = hit.get("list_title", "")
+                title = hit.get("title", "")
 
             results.append(
-                SearchStdDocsItemDTO(
-                    list_id=list_id,
-                    list_title=list_title,
-                    org_nm=org_nm,
-                    title=title,
-                    score=hit.get("_score"),
-                    data_type=data_type,
-                    detail=detail,
-                )
+                {
+                    "list_id": list_id,
+                    "list_title": list_title,
+                    "org_nm": org_nm,
+                    "title": title,
+                    "score": hit.get("_score"),
+                    "data_type": data_type,
+                    "detail": detail,
+                }
             )
 
         return SearchStdDocsResponseDTO(
@@ -357,8 +362,8 @@ class SearchAppService:
             search_service=search_service,
         )
 
-    def get_index_stats(self, *, search_service: Any) -> dict[str, Any]:
-        stats = search_service.get_index_stats()
+    async def get_index_stats(self, *, search_service: Any) -> dict[str, Any]:
+        stats = await search_service.get_index_stats()
         return {
             "index_name": "open_data_titles",
             "total_docs": stats["total"]["docs"]["count"],
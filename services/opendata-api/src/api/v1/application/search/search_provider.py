@@ -13,15 +13,82 @@
 # limitations under the License.
 from typing import Any
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch
+
+# 요청마다 같은 구조를 다시 만들지 않도록 고정 값은 모듈에서 한 번만 생성
+_FUZZY_MATCH_OPTIONS = {
+    "fields": (
+        "list_title^3",
+        "title^2",
+        "title.korean^2",
+        "org_nm^1.5",
+        "dept_nm^1.5",
+        "desc^0.8",
+    ),
+    "type": "best_fields",
+    "fuzziness": "1",
+    "max_expansions": 50,
+    "prefix_length": 1,
+    "fuzzy_transpositions": True,
+    "operator": "and",
+    "minimum_should_match": "75%",
+}
+_PHRASE_MATCH_OPTIONS = {
+    "fields": ("list_title^4", "title^3", "org_nm^2"),
+    "type": "phrase",
+    "boost": 4.0,
+}
+_WEIGHTED_MATCH_OPTIONS = {
+    "fields": (
+        "list_title^3",
+        "title^2",
+        "title.korean^2",
+        "keywords^2",
+        "org_nm^1.5",
+        "category_nm^1.5",
+        "dept_nm^1.5",
+        "desc^0.8",
+    ),
+    "type": "best_fields",
+    "fuzziness": "AUTO",
+    "max_expansions": 50,
+    "prefix_length": 1,
+    "fuzzy_transpositions": True,
+    "operator": "or",
+}
+# 호출 측에서 실제로 읽는 필드만 반환 (desc, keywords 등 큰 필드 제외)
+_SOURCE_FIELDS = ("list_id", "list_title", "title", "org_nm", "data_type")
+# 퍼지 쿼리와 결합 시 비용이 큰 분석 필드(keywords, title.korean)는 제외
+_HIGHLIGHT_CONFIG = {
+    "type": "unified",
+    "no_match_size": 0,
+    "max_analyzed_offset": 1000000,
+    "fields": {
+        "list_title": {},
+        "title": {},
+        "org_nm": {},
+    },
+}
+
+
+def _flatten_hits(hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """ES hit에서 호출 측이 쓰는 _source, 점수, 하이라이트만 펼쳐서 반환"""
+    return [
+        {
+            **hit["_source"],
+            "_score": hit["_score"],
+            "_highlight": hit.get("highlight"),
+        }
+        for hit in hits
+    ]
 
 
 class SearchProvider:
-    def __init__(self, es_client: Elasticsearch):
+    def __init__(self, es_client: AsyncElasticsearch):
         self.es = es_client
         self.index_name = "open_data_titles"
 
-    def search_titles(
+    async def search_titles(
         self,
         query: str,
         size: int = 10,
@@ -48,15 +115,8 @@ class SearchProvider:
 
         search_body = {
             "query": search_query,
-            "highlight": {
-                "fields": {
-                    "list_title": {},
-                    "title": {},
-                    "title.korean": {},
-                    "keywords": {},
-                    "org_nm": {},
-                }
-            },
+            "_source": _SOURCE_FIELDS,
+            "highlight": self._get_highlight_config(),
             "size": size,
             "from": from_,
         }
@@ -65,11 +125,20 @@ class SearchProvider:
             search_body["min_score"] = min_score
 
         try:
-            response = self.es.search(index=self.index_name, **search_body)
-            return response["hits"]
+            response = await self.es.search(
+                index=self.index_name, **search_body
+            )
+            hits = response["hits"]
+            return {
+                "total": hits["total"]["value"],
+                "items": _flatten_hits(hits["hits"]),
+            }
         except Exception:
             raise
 
+    def _get_highlight_config(self) -> dict[str, Any]:
+        return _HIGHLIGHT_CONFIG
+
     def _build_exact_match_query(self, query: str) -> dict[str, Any]:
         return {
             "bool": {
@@ -94,37 +163,14 @@ class SearchProvider:
         return {
             "bool": {
                 "should": [
-                    {
-                        "multi_match": {
-                            "query": query,
-                            "fields": [
-                                "list_title^3",
-                                "title^2",
-                                "title.korean^2",
-                                "org_nm^1.5",
-                                "dept_nm^1.5",
-                                "desc^0.8",
-                            ],
-                            "type": "best_fields",
-                            "fuzziness": "1",
-                            "operator": "and",
-                            "minimum_should_match": "75%",
-                        }
-                    },
-                    {
-                        "multi_match": {
-                            "query": query,
-                            "fields": ["list_title^4", "title^3", "org_nm^2"],
-                            "type": "phrase",
-                            "boost": 4.0,
-                        }
-                    },
+                    {"multi_match": {**_FUZZY_MATCH_OPTIONS, "query": query}},
+                    {"multi_match": {**_PHRASE_MATCH_OPTIONS, "query": query}},
                 ],
                 "minimum_should_match": 1,
             }
         }
 
-    def search_titles_with_weights(
+    async def search_titles_with_weights(
         self,
         queries: list[str],
         weights: list[float] | None = None,
@@ -132,7 +178,7 @@ class SearchProvider:
         from_: int = 0,
     ) -> dict[str, Any]:
         if not queries:
-            return {"hits": []}
+            return {"total": 0, "items": []}
 
         if weights is None:
             weights = [1.0] * len(queries)
@@ -142,53 +188,104 @@ class SearchProvider:
             weight = weights[i] if i < len(weights) else 1.0
             should_clauses.append(self._build_weighted_query(query, weight))
 
+        combined_query = {
+            "bool": {"should": should_clauses, "minimum_should_match": 1}
+        }
+        # 합산 순위는 각 쿼리 상위 size건 안에서만 정확하므로 첫 페이지에만 사용
+        if len(should_clauses) > 1 and from_ == 0:
+            return await self._msearch_weighted(
+                should_clauses, combined_query, size
+            )
+
         search_body = {
-            "query": {
-                "bool": {"should": should_clauses, "minimum_should_match": 1}
-            },
-            "highlight": {
-                "fields": {
-                    "list_title": {},
-                    "title": {},
-                    "title.korean": {},
-                    "keywords": {},
-                    "org_nm": {},
-                }
-            },
+            "query": combined_query,
+            "_source": _SOURCE_FIELDS,
+            "highlight": self._get_highlight_config(),
             "size": size,
             "from": from_,
         }
 
         try:
-            response = self.es.search(index=self.index_name, **search_body)
-            return response["hits"]
+            response = await self.es.search(
+                index=self.index_name, **search_body
+            )
+            hits = response["hits"]
+            return {
+                "total": hits["total"]["value"],
+                "items": _flatten_hits(hits["hits"]),
+            }
+        except Exception:
+            raise
+
+    async def _msearch_weighted(
+        self,
+        clauses: list[dict[str, Any]],
+        combined_query: dict[str, Any],
+        size: int,
+    ) -> dict[str, Any]:
+        """쿼리별로 msearch 후 bool should처럼 문서 점수를 합산해 정렬
+
+        각 쿼리의 상위 size건만 합치므로 모든 쿼리에서 size 밖에 있던 문서는
+        합산 점수가 더 높아도 빠질 수 있다. total은 결합 쿼리의 건수를 쓴다.
+        """
+        # 첫 항목은 결합 쿼리의 전체 건수만 세는 검색
+        searches: list[dict[str, Any]] = [
+            {"index": self.index_name},
+            {"query": combined_query, "size": 0},
+        ]
+        for clause in clauses:
+            searches.append({"index": self.index_name})
+            searches.append(
+                {
+                    "query": clause,
+                    "_source": _SOURCE_FIELDS,
+                    "highlight": self._get_highlight_config(),
+                    "size": size,
+                }
+            )
+
+        try:
+            response = await self.es.msearch(searches=searches)
         except Exception:
             raise
 
+        results = response["responses"]
+        for result in results:
+            if "error" in result:
+                raise RuntimeError(f"msearch 실패: {result['error']}")
+
+        merged: dict[str, dict[str, Any]] = {}
+        scores: dict[str, float] = {}
+        for result in results[1:]:
+            for hit in result["hits"]["hits"]:
+                doc_id = hit["_id"]
+                merged.setdefault(doc_id, hit)
+                scores[doc_id] = scores.get(doc_id, 0.0) + (hit["_score"] or 0)
+
+        ranked = sorted(merged, key=scores.__getitem__, reverse=True)
+        hits = []
+        for doc_id in ranked[:size]:
+            hit = merged[doc_id]
+            hit["_score"] = scores[doc_id]
+            hits.append(hit)
+
+        return {
+            "total": results[0]["hits"]["total"]["value"],
+            "items": _flatten_hits(hits),
+        }
+
     def _build_weighted_query(
         self, query: str, weight: float
     ) -> dict[str, Any]:
         return {
             "multi_match": {
+                **_WEIGHTED_MATCH_OPTIONS,
                 "query": query,
-                "fields": [
-                    "list_title^3",
-                    "title^2",
-                    "title.korean^2",
-                    "keywords^2",
-                    "org_nm^1.5",
-                    "category_nm^1.5",
-                    "dept_nm^1.5",
-                    "desc^0.8",
-                ],
-                "type": "best_fields",
-                "fuzziness": "AUTO",
-                "operator": "or",
                 "boost": weight,
             }
         }
 
-    def search_titles_with_adaptive_filtering(
+    async def search_titles_with_adaptive_filtering(
         self,
         query: str,
         size: int = 10,
@@ -227,40 +324,38 @@ class SearchProvider:
             }
         }
 
-        search_body = {
-            "query": strict_query,
-            "highlight": {
-                "fields": {
-                    "list_title": {},
-                    "title": {},
-                    "title.korean": {},
-                    "keywords": {},
-                    "org_nm": {},
-                }
-            },
-            "size": size,
-            "from": from_,
-        }
-
         try:
-            response = self.es.search(index=self.index_name, **search_body)
-            hits = response["hits"]
+            search_body = {
+                "query": strict_query,
+                "_source": _SOURCE_FIELDS,
+                "highlight": self._get_highlight_config(),
+                "size": size,
+                "from": from_,
+            }
 
-            if hits["total"]["value"] >= size:
-                return hits
+            response = await self.es.search(
+                index=self.index_name, **search_body
+            )
+            hits = response["hits"]
 
-            relaxed_query = self._build_fuzzy_match_query(query)
-            search_body["query"] = relaxed_query
+            if hits["total"]["value"] < size:
+                search_body["query"] = self._build_fuzzy_match_query(query)
+                response = await self.es.search(
+                    index=self.index_name, **search_body
+                )
+                hits = response["hits"]
 
-            response = self.es.search(index=self.index_name, **search_body)
-            return response["hits"]
+            return {
+                "total": hits["total"]["value"],
+                "items": _flatten_hits(hits["hits"]),
+            }
 
         except Exception:
             raise
 
-    def get_index_stats(self) -> dict[str, Any]:
+    async def get_index_stats(self) -> dict[str, Any]:
         try:
-            stats = self.es.indices.stats(index=self.index_name)
+            stats = await self.es.indices.stats(index=self.index_name)
             return stats["indices"][self.index_name]
         except Exception:
             raise
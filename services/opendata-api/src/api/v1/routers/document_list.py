@@ -15,11 +15,9 @@ import logging
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
 
-from api.v1.application.open_data.dto import (
-    PaginatedUnifiedDataDTO,
-    UnifiedDataItemDTO,
-)
+from api.v1.application.open_data.dto import create_paginated_response
 from core.dependencies import (
     get_app_pagination_service,
     get_app_search_service,
@@ -28,6 +26,7 @@ from core.dependencies import (
     get_search_service,
     limiter,
 )
+from core.settings import get_settings
 from models import GeneratedAPIDocs, GeneratedFileDocs
 from utils.datetime_util import format_datetime
 
@@ -94,16 +93,15 @@ async def get_list(
                 if item.get("list_title"):
                     item["list_title"] = item["list_title"].replace("_", " ")
 
-            dto_result = PaginatedUnifiedDataDTO(
-                items=[UnifiedDataItemDTO(**item) for item in items_data],
-                total=total,
-                page=page,
-                size=size,
-                total_pages=total_pages,
-                has_next=page < total_pages,
-                has_prev=page > 1,
+            return ORJSONResponse(
+                create_paginated_response(
+                    items_data,
+                    total=total,
+                    page=page,
+                    size=size,
+                    validate=get_settings().debug,
+                )
             )
-            return dto_result.model_dump(by_alias=True)
 
         if sort_by not in ["popular", "trending", "all"]:
             raise HTTPException(
@@ -164,9 +162,7 @@ async def get_list(
                     if file_doc:
                         generated_at = getattr(file_doc, "generated_at", None)
 
-                generated_at_str = (
-                    format_datetime(generated_at) if generated_at else None
-                )
+                generated_at_str = format_datetime(generated_at)
 
                 list_title = item.list_title or item.title
                 if list_title:
@@ -185,16 +181,15 @@ async def get_list(
                     }
                 )
 
-            dto_result = PaginatedUnifiedDataDTO(
-                items=[UnifiedDataItemDTO(**i) for i in formatted_items],
-                total=final_total,
-                page=dto.page,
-                size=dto.size,
-                total_pages=total_pages,
-                has_next=dto.page < total_pages,
-                has_prev=dto.page > 1,
+            return ORJSONResponse(
+                create_paginated_response(
+                    formatted_items,
+                    total=final_total,
+                    page=dto.page,
+                    size=dto.size,
+                    validate=get_settings().debug,
+                )
             )
-            return dto_result.model_dump(by_alias=True)
 
         formatted_items = []
         for item in rank_result["data"]:
@@ -226,16 +221,15 @@ async def get_list(
                 detail=f"페이지 번호가 범위를 초과했습니다. (요청: {page}, 최대: {total_pages})",
             )
 
-        dto_result = PaginatedUnifiedDataDTO(
-            items=[UnifiedDataItemDTO(**i) for i in formatted_items],
-            total=total,
-            page=page,
-            size=size,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1,
+        return ORJSONResponse(
+            create_paginated_response(
+                formatted_items,
+                total=total,
+                page=page,
+                size=size,
+                validate=get_settings().debug,
+            )
         )
-        return dto_result.model_dump(by_alias=True)
     except Exception as e:
         logger.exception(f"[Document/List] 에러: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
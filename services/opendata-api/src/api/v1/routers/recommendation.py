@@ -11,10 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from core.dependencies import get_recommendation_service
 
@@ -26,6 +27,8 @@ router = APIRouter(prefix="/recommendation", tags=["recommendation"])
 class RecommendationItem(BaseModel):
     """추천 아이템 모델"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     doc_id: str = Field(..., description="문서 ID")
     similarity_score: float = Field(..., description="유사도 점수")
     rank: int = Field(..., description="추천 순위")
@@ -112,8 +115,8 @@ async def get_recommendations_realtime(
         logger.info(
             f"실시간 추천 요청: doc_id={doc_id}, top_k={top_k}, threshold={threshold}"
         )
-        recommendations = service.get_recommendations_realtime(
-            doc_id, top_k, threshold
+        recommendations = await asyncio.to_thread(
+            service.get_recommendations_realtime, doc_id, top_k, threshold
         )
         recommendation_items = [
             RecommendationItem(
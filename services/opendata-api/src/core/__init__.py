@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from .clients import create_async_es_client, get_es_client
 from .dependencies import (
     ServiceContainer,
     get_cross_collection_service,
@@ -25,8 +26,10 @@ from .dependencies import (
 )
 from .exceptions import create_openapi_http_exception_doc
 from .settings import (
+    InfraSettings,
     Settings,
     get_development_settings,
+    get_infra_settings,
     get_production_settings,
     get_settings,
     get_test_settings,
@@ -34,7 +37,9 @@ from .settings import (
 
 __all__ = [
     "Settings",
+    "InfraSettings",
     "get_settings",
+    "get_infra_settings",
     "get_development_settings",
     "get_production_settings",
     "get_test_settings",
@@ -44,6 +49,8 @@ __all__ = [
     "get_settings_dependency",
     "get_service_container_with_settings",
     "get_elasticsearch_client",
+    "get_es_client",
+    "create_async_es_client",
     "get_mongo_client",
     "get_cross_collection_service",
     "get_search_service",
@@ -0,0 +1,57 @@
+# Copyright 2025 Team Aeris
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from functools import cache
+from typing import Any
+
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+from elasticsearch.serializer import JSONSerializer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonSerializer(JSONSerializer):
+    """orjson으로 요청/응답 본문을 직렬화하는 Elasticsearch 직렬화기"""
+
+    def dumps(self, data: Any) -> bytes:
+        if isinstance(data, (str, bytes)):
+            return super().dumps(data)
+        return orjson.dumps(data, default=self.default)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+def _es_client_options() -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "http_compress": True,
+        "request_timeout": 30,
+        "connections_per_node": 25,
+    }
+    if orjson is not None:
+        options["serializer"] = OrjsonSerializer()
+    return options
+
+
+@cache
+def get_es_client(*hosts: str) -> Elasticsearch:
+    """호스트 조합별로 하나의 Elasticsearch 클라이언트를 재사용"""
+    return Elasticsearch(list(hosts), **_es_client_options())
+
+
+def create_async_es_client(*hosts: str) -> AsyncElasticsearch:
+    """API 서버용 비동기 클라이언트 (이벤트 루프 안에서 생성 후 종료 시 close)"""
+    return AsyncElasticsearch(list(hosts), **_es_client_options())
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import inspect
 import logging
 from contextlib import asynccontextmanager
 from functools import lru_cache
 from typing import Any
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.responses import Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -25,6 +26,7 @@ from slowapi.util import get_remote_address
 
 from db import MongoDB
 
+from .clients import create_async_es_client
 from .settings import Settings, get_settings
 
 limiter = Limiter(key_func=get_remote_address)
@@ -73,7 +75,7 @@ class ServiceContainer:
             await MongoDB.init(settings.MONGO_URL, settings.MONGO_DB)
             self._services["mongo_client"] = MongoDB.get_client()
 
-            es_client = Elasticsearch([settings.ELASTICSEARCH_URL])
+            es_client = create_async_es_client(settings.ELASTICSEARCH_URL)
             self._services["elasticsearch"] = es_client
 
             self._initialized = True
@@ -91,9 +93,13 @@ class ServiceContainer:
         for service_name, service in self._services.items():
             try:
                 if hasattr(service, "close"):
-                    await service.close()
+                    result = service.close()
                 elif hasattr(service, "shutdown"):
-                    await service.shutdown()
+                    result = service.shutdown()
+                else:
+                    continue
+                if inspect.isawaitable(result):
+                    await result
             except Exception as e:
                 logger.warning(f"서비스 {service_name} 종료 중 오류: {e}")
 
@@ -184,7 +190,7 @@ def get_service_container_with_settings(
     return service_container
 
 
-def get_elasticsearch_client() -> Elasticsearch:
+def get_elasticsearch_client() -> AsyncElasticsearch:
     return service_container._services.get("elasticsearch")
 
 
@@ -192,6 +198,17 @@ def get_mongo_client():
     return service_container._services.get("mongo_client")
 
 
+def get_milvus_client():
+    from pymilvus import MilvusClient
+
+    milvus_client = service_container._services.get("milvus")
+    if milvus_client is None:
+        settings = service_container.get_settings()
+        milvus_client = MilvusClient(uri=settings.MILVUS_URL)
+        service_container._services["milvus"] = milvus_client
+    return milvus_client
+
+
 def get_cross_collection_service():
     from api.v1.application.catalog.catalog_service import CatalogService
 
@@ -243,4 +260,4 @@ def get_app_documents_service():
 def get_recommendation_service():
     from recommend_system.recommendation_service import RecommendationService
 
-    return RecommendationService()
+    return RecommendationService(milvus_client=get_milvus_client())
@@ -12,19 +12,107 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from functools import lru_cache
-from typing import Type
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Type
 
 from pydantic import Field
+from pydantic.fields import FieldInfo
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
 )
-from pydantic_settings.sources import PyprojectTomlConfigSettingsSource
+
+try:
+    import tomllib
+except ModuleNotFoundError:
+    import tomli as tomllib
+
+_PYPROJECT_CACHE: dict[tuple[str, int], dict[str, Any]] = {}
+
+
+def _load_pyproject_table(
+    path: Path, table_header: tuple[str, ...]
+) -> dict[str, Any]:
+    """pyproject.toml 테이블을 (경로, mtime) 기준으로 캐시하여 반환"""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    key = (str(path), mtime_ns)
+    cached = _PYPROJECT_CACHE.get(key)
+    if cached is None:
+        with open(path, "rb") as f:
+            cached = tomllib.load(f)
+        for header in table_header:
+            cached = cached.get(header, {})
+        _PYPROJECT_CACHE[key] = cached
+    return cached
+
+
+class LazyPyprojectTomlSettingsSource(PydanticBaseSettingsSource):
+    """pyproject.toml을 실제로 값을 읽을 때만 파싱하는 설정 소스"""
+
+    def __init__(self, settings_cls: Type[BaseSettings]):
+        super().__init__(settings_cls)
+        self._toml_file = Path(self.config.get("toml_file") or "pyproject.toml")
+        self._table_header = tuple(
+            self.config.get("pyproject_toml_table_header") or ()
+        )
+        self._data: dict[str, Any] | None = None
+
+    def get_field_value(
+        self, field: FieldInfo, field_name: str
+    ) -> tuple[Any, str, bool]:
+        return None, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = dict(
+                _load_pyproject_table(self._toml_file, self._table_header)
+            )
+        return self._data
 
 
-class Settings(BaseSettings):
+class InfraSettings(BaseSettings):
+    """외부 인프라 접속 정보 (환경 변수만 사용, pyproject.toml 미파싱)"""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        case_sensitive=False,
+    )
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (init_settings, env_settings, dotenv_settings)
+
+    MONGO_URL: str = Field(
+        default="mongodb://localhost:27017", alias="MONGO_URL"
+    )
+    MONGO_DB: str = Field(default="open_data", alias="MONGO_DB")
+
+    ELASTICSEARCH_URL: str = Field(
+        default="http://localhost:9200", alias="ELASTICSEARCH_URL"
+    )
+    ELASTICSEARCH_INDEX_NAME: str = Field(
+        default="open_data_titles", alias="ELASTICSEARCH_INDEX"
+    )
+
+    MILVUS_URL: str = Field(default="http://milvus:19530", alias="MILVUS_URL")
+
+
+class Settings(InfraSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -32,6 +120,7 @@ class Settings(BaseSettings):
         pyproject_toml_table_header=("project",),
         extra="ignore",
         case_sensitive=False,
+        ignored_types=(cached_property,),
     )
 
     @classmethod
@@ -45,7 +134,7 @@ class Settings(BaseSettings):
     ) -> tuple[PydanticBaseSettingsSource, ...]:
         return (
             init_settings,
-            PyprojectTomlConfigSettingsSource(settings_cls),
+            LazyPyprojectTomlSettingsSource(settings_cls),
             env_settings,
             dotenv_settings,
         )
@@ -78,19 +167,7 @@ class Settings(BaseSettings):
     enable_request_logging: bool = True
     request_timeout: int = 60
 
-    MONGO_URL: str = Field(
-        default="mongodb://localhost:27017", alias="MONGO_URL"
-    )
-    MONGO_DB: str = Field(default="open_data", alias="MONGO_DB")
-
-    ELASTICSEARCH_URL: str = Field(
-        default="http://localhost:9200", alias="ELASTICSEARCH_URL"
-    )
-    ELASTICSEARCH_INDEX_NAME: str = Field(
-        default="open_data_titles", alias="ELASTICSEARCH_INDEX"
-    )
-
-    MILVUS_URL: str = Field(default="http://milvus:19530", alias="MILVUS_URL")
+    skip_validation_on_read: bool = True
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -125,23 +202,23 @@ class Settings(BaseSettings):
 
         return ["*"]
 
-    @property
+    @cached_property
     def docs_url(self) -> str | None:
         return "/docs" if self.enable_docs else None
 
-    @property
+    @cached_property
     def redoc_url(self) -> str | None:
         return "/redoc" if self.enable_redoc else None
 
-    @property
+    @cached_property
     def is_local(self) -> bool:
         return self.env == "local"
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         return self.env == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         return self.env == "production"
 
@@ -157,10 +234,16 @@ def get_settings() -> Settings:
     return _settings_instance
 
 
+@lru_cache(maxsize=1)
+def get_infra_settings() -> InfraSettings:
+    return InfraSettings()
+
+
 def reset_settings() -> None:
     global _settings_instance
     _settings_instance = None
     get_settings.cache_clear()
+    get_infra_settings.cache_clear()
 
 
 def get_development_settings() -> Settings:
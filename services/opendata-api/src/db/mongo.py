@@ -11,7 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from beanie import init_beanie
+import hashlib
+import json
+
+from beanie import Document, init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from models import (
@@ -27,31 +30,74 @@ from models import (
     SavedRequest,
 )
 
+DOCUMENT_MODELS: list[type[Document]] = [
+    OpenAPIInfo,
+    OpenFileInfo,
+    GeneratedFileDocs,
+    GeneratedAPIDocs,
+    RankLatest,
+    RankPopular,
+    RankTrending,
+    RankMetadata,
+    SavedRequest,
+    DocRecommendation,
+]
+
+SCHEMA_META_COLLECTION = "_beanie_meta"
+
+
+def compute_schema_hash(models: list[type[Document]]) -> str:
+    """모델 스키마와 인덱스 정의로부터 해시를 계산"""
+    payload = sorted(
+        (
+            model.__name__,
+            model.model_json_schema(),
+            repr(getattr(model.Settings, "indexes", None)),
+        )
+        for model in models
+    )
+    return hashlib.blake2b(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
 
 class MongoDB:
     _client: AsyncIOMotorClient | None = None
     _database: AsyncIOMotorDatabase | None = None
+    _initialized: tuple[str, str] | None = None
 
     @classmethod
     async def init(cls, mongo_uri: str, database_name: str):
-        cls._client = AsyncIOMotorClient(mongo_uri)
+        if cls._initialized == (mongo_uri, database_name):
+            return
+
+        if cls._client:
+            cls._client.close()
+
+        cls._client = AsyncIOMotorClient(
+            mongo_uri, uuidRepresentation="standard"
+        )
         cls._database = AsyncIOMotorDatabase(cls._client, database_name)
+
+        schema_hash = compute_schema_hash(DOCUMENT_MODELS)
+        meta_collection = cls._database[SCHEMA_META_COLLECTION]
+        meta = await meta_collection.find_one({"_id": "schema"})
+        skip_indexes = meta is not None and meta.get("hash") == schema_hash
+
         await init_beanie(
             database=cls._database,
-            document_models=[
-                OpenAPIInfo,
-                OpenFileInfo,
-                GeneratedFileDocs,
-                GeneratedAPIDocs,
-                RankLatest,
-                RankPopular,
-                RankTrending,
-                RankMetadata,
-                SavedRequest,
-                DocRecommendation,
-            ],
+            document_models=DOCUMENT_MODELS,
+            skip_indexes=skip_indexes,
         )
 
+        if not skip_indexes:
+            await meta_collection.update_one(
+                {"_id": "schema"},
+                {"$set": {"hash": schema_hash}},
+                upsert=True,
+            )
+        cls._initialized = (mongo_uri, database_name)
+
     @classmethod
     def get_db(cls) -> AsyncIOMotorDatabase:
         if cls._database is None:
@@ -70,3 +116,4 @@ class MongoDB:
             cls._client.close()
             cls._client = None
             cls._database = None
+            cls._initialized = None
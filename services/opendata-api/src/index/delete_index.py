@@ -13,17 +13,15 @@
 # limitations under the License.
 import logging
 
-from elasticsearch import Elasticsearch
-
-from core.settings import get_settings
-
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 def delete_elasticsearch_index():
-    settings = get_settings()
-    es = Elasticsearch([settings.ELASTICSEARCH_URL])
+    from core.clients import get_es_client
+    from core.settings import get_infra_settings
+
+    settings = get_infra_settings()
+    es = get_es_client(settings.ELASTICSEARCH_URL)
     index_name = settings.ELASTICSEARCH_INDEX_NAME
 
     try:
@@ -38,4 +36,5 @@ def delete_elasticsearch_index():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     delete_elasticsearch_index()
@@ -12,17 +12,206 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import json
 import logging
-from typing import Any
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, AsyncIterator
 
-from elasticsearch import Elasticsearch
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from core.settings import get_settings
-from models import OpenAPIInfo, OpenFileInfo
-
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_INDEX_MAPPING = MappingProxyType(
+    {
+        "mappings": {
+            "properties": {
+                "list_title": {
+                    "type": "text",
+                    "analyzer": "nori_analyzer",
+                    "search_analyzer": "nori_analyzer",
+                    "fields": {
+                        "keyword": {
+                            "type": "keyword",
+                            "ignore_above": 256,
+                        },
+                        "ngram": {
+                            "type": "text",
+                            "analyzer": "ngram_analyzer",
+                        },
+                    },
+                },
+                "list_id": {"type": "integer"},
+                "title": {
+                    "type": "text",
+                    "analyzer": "english_analyzer",
+                    "search_analyzer": "english_analyzer",
+                    "fields": {
+                        "keyword": {
+                            "type": "keyword",
+                            "ignore_above": 256,
+                        },
+                        "korean": {
+                            "type": "text",
+                            "analyzer": "nori_analyzer",
+                        },
+                    },
+                },
+                "category_nm": {"type": "keyword"},
+                "dept_nm": {"type": "keyword"},
+                "org_nm": {
+                    "type": "text",
+                    "analyzer": "nori_analyzer",
+                    "search_analyzer": "nori_analyzer",
+                },
+                "keywords": {"type": "keyword"},
+                "desc": {
+                    "type": "text",
+                    "analyzer": "nori_analyzer",
+                    "search_analyzer": "nori_analyzer",
+                },
+                "data_format": {"type": "keyword"},
+                "api_type": {"type": "keyword"},
+            }
+        },
+        "settings": {
+            "analysis": {
+                "analyzer": {
+                    "nori_analyzer": {
+                        "type": "nori",
+                        "tokenizer": "nori_tokenizer",
+                        "filter": [
+                            "nori_readingform",
+                            "lowercase",
+                            "trim",
+                        ],
+                    },
+                    "english_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "standard",
+                        "filter": [
+                            "lowercase",
+                            "english_stop",
+                            "english_stemmer",
+                            "trim",
+                        ],
+                    },
+                    "ngram_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "standard",
+                        "filter": ["lowercase", "ngram_filter"],
+                    },
+                },
+                "filter": {
+                    "ngram_filter": {
+                        "type": "ngram",
+                        "min_gram": 2,
+                        "max_gram": 3,
+                    },
+                    "english_stop": {
+                        "type": "stop",
+                        "stopwords": "_english_",
+                    },
+                    "english_stemmer": {
+                        "type": "stemmer",
+                        "language": "english",
+                    },
+                },
+            },
+            "index": {"max_ngram_diff": 50},
+        },
+    }
+)
+
+_BULK_LOAD_SETTINGS = {
+    "index": {"refresh_interval": "-1", "number_of_replicas": 0}
+}
+_DEFAULT_INDEX_SETTINGS = {
+    "index": {"refresh_interval": None, "number_of_replicas": None}
+}
+
+_INDEX_BATCH_SIZE = 1000
+
+_API_PROJECTION = {
+    "_id": 0,
+    "list_id": 1,
+    "list_title": 1,
+    "title_en": 1,
+    "category_nm": 1,
+    "dept_nm": 1,
+    "org_nm": 1,
+    "keywords": 1,
+    "desc": 1,
+    "data_format": 1,
+    "api_type": 1,
+    "request_cnt": 1,
+}
+
+_FILE_PROJECTION = {
+    "_id": 0,
+    "list_id": 1,
+    "list_title": 1,
+    "title": 1,
+    "new_category_nm": 1,
+    "dept_nm": 1,
+    "org_nm": 1,
+    "keywords": 1,
+    "desc": 1,
+    "data_type": 1,
+}
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+_SOURCE_KEYS = (
+    "list_id",
+    "list_title",
+    "title",
+    "category_nm",
+    "dept_nm",
+    "org_nm",
+    "keywords",
+    "desc",
+    "data_format",
+    "api_type",
+)
+
+_API_DEFAULTS = {
+    "list_id": None,
+    "list_title": "",
+    "title_en": "",
+    "category_nm": "",
+    "dept_nm": "",
+    "org_nm": "",
+    "keywords": [],
+    "desc": "",
+    "data_format": "",
+    "api_type": "",
+}
+_api_fields = itemgetter(*_API_DEFAULTS)
+
+_FILE_DEFAULTS = {
+    "list_id": None,
+    "list_title": "",
+    "title": "",
+    "new_category_nm": "",
+    "dept_nm": "",
+    "org_nm": "",
+    "keywords": [],
+    "desc": "",
+    "data_type": "",
+}
+_file_fields = itemgetter(*_FILE_DEFAULTS)
+
 
 class TitleIndexer:
     def __init__(
@@ -30,198 +219,115 @@ class TitleIndexer:
         mongo_uri: str | None = None,
         es_hosts: list[str] | None = None,
     ):
-        settings = get_settings()
+        from core.clients import get_es_client
+        from core.settings import get_infra_settings
+
+        settings = get_infra_settings()
         if mongo_uri is None:
             mongo_uri = settings.MONGO_URL
         if es_hosts is None:
             es_hosts = [settings.ELASTICSEARCH_URL]
 
         self.mongo_uri = mongo_uri
-        self.es = Elasticsearch(hosts=es_hosts)
+        self.mongo_db = None
+        self.es = get_es_client(*es_hosts)
         self.index_name = settings.ELASTICSEARCH_INDEX_NAME
 
     async def initialize_beanie(self):
         from beanie import init_beanie
         from motor.motor_asyncio import AsyncIOMotorClient
 
+        from models import OpenAPIInfo, OpenFileInfo
+
         mongo_client = AsyncIOMotorClient(self.mongo_uri)
         await init_beanie(
             database=mongo_client.open_data,
             document_models=[OpenAPIInfo, OpenFileInfo],
         )
+        self.mongo_db = mongo_client.open_data
         return mongo_client
 
-    async def get_all_open_api_info(self) -> list[dict[str, Any]]:
+    async def iter_open_api_info(self) -> AsyncIterator[dict[str, Any]]:
+        from models import OpenAPIInfo
+
         try:
-            documents = await OpenAPIInfo.find_all().to_list()
-            return [doc.model_dump() for doc in documents]
+            collection = self.mongo_db[OpenAPIInfo.Settings.name]
+            async for doc in collection.find({}, _API_PROJECTION):
+                yield doc
         except Exception as e:
             logger.error(f"OpenAPIInfo 조회 중 오류 발생: {e}")
             raise
 
-    async def get_all_open_file_info(self) -> list[dict[str, Any]]:
+    async def iter_open_file_info(self) -> AsyncIterator[dict[str, Any]]:
+        from models import OpenFileInfo
+
         try:
-            documents = await OpenFileInfo.find_all().to_list()
-            return [doc.model_dump() for doc in documents]
+            collection = self.mongo_db[OpenFileInfo.Settings.name]
+            async for doc in collection.find({}, _FILE_PROJECTION):
+                yield doc
         except Exception as e:
             logger.error(f"OpenFileInfo 조회 중 오류 발생: {e}")
             raise
 
-    def create_elasticsearch_index(self):
-        mapping = {
-            "mappings": {
-                "properties": {
-                    "list_title": {
-                        "type": "text",
-                        "analyzer": "nori_analyzer",
-                        "search_analyzer": "nori_analyzer",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword",
-                                "ignore_above": 256,
-                            },
-                            "ngram": {
-                                "type": "text",
-                                "analyzer": "ngram_analyzer",
-                            },
-                        },
-                    },
-                    "list_id": {"type": "integer"},
-                    "title": {
-                        "type": "text",
-                        "analyzer": "english_analyzer",
-                        "search_analyzer": "english_analyzer",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword",
-                                "ignore_above": 256,
-                            },
-                            "korean": {
-                                "type": "text",
-                                "analyzer": "nori_analyzer",
-                            },
-                        },
-                    },
-                    "category_nm": {"type": "keyword"},
-                    "dept_nm": {"type": "keyword"},
-                    "org_nm": {
-                        "type": "text",
-                        "analyzer": "nori_analyzer",
-                        "search_analyzer": "nori_analyzer",
-                    },
-                    "keywords": {"type": "keyword"},
-                    "desc": {
-                        "type": "text",
-                        "analyzer": "nori_analyzer",
-                        "search_analyzer": "nori_analyzer",
-                    },
-                    "data_format": {"type": "keyword"},
-                    "api_type": {"type": "keyword"},
-                }
-            },
-            "settings": {
-                "analysis": {
-                    "analyzer": {
-                        "nori_analyzer": {
-                            "type": "nori",
-                            "tokenizer": "nori_tokenizer",
-                            "filter": [
-                                "nori_readingform",
-                                "lowercase",
-                                "trim",
-                            ],
-                        },
-                        "english_analyzer": {
-                            "type": "custom",
-                            "tokenizer": "standard",
-                            "filter": [
-                                "lowercase",
-                                "english_stop",
-                                "english_stemmer",
-                                "trim",
-                            ],
-                        },
-                        "ngram_analyzer": {
-                            "type": "custom",
-                            "tokenizer": "standard",
-                            "filter": ["lowercase", "ngram_filter"],
-                        },
-                    },
-                    "filter": {
-                        "ngram_filter": {
-                            "type": "ngram",
-                            "min_gram": 2,
-                            "max_gram": 3,
-                        },
-                        "english_stop": {
-                            "type": "stop",
-                            "stopwords": "_english_",
-                        },
-                        "english_stemmer": {
-                            "type": "stemmer",
-                            "language": "english",
-                        },
-                    },
-                },
-                "index": {"max_ngram_diff": 50},
-            },
-        }
+    async def iter_all_documents(self) -> AsyncIterator[dict[str, Any]]:
+        async for doc in self.iter_open_api_info():
+            yield doc
+        async for doc in self.iter_open_file_info():
+            yield doc
 
+    def create_elasticsearch_index(self):
         try:
             if not self.es.indices.exists(index=self.index_name):
-                self.es.indices.create(index=self.index_name, **mapping)
+                self.es.indices.create(index=self.index_name, **_INDEX_MAPPING)
         except Exception as e:
             logger.error(f"인덱스 생성 중 오류 발생: {e}")
             raise
 
-    def index_documents(self, documents: list[dict[str, Any]]):
+    def index_documents(
+        self, documents: list[dict[str, Any]]
+    ) -> tuple[int, int]:
         try:
-            api_count = 0
-            file_count = 0
+            api_docs = [doc for doc in documents if "request_cnt" in doc]
+            file_docs = [doc for doc in documents if "request_cnt" not in doc]
 
-            for doc in documents:
-                if "request_cnt" in doc:
-                    es_doc = {
-                        "list_id": doc.get("list_id"),
-                        "list_title": doc.get("list_title", ""),
-                        "title": doc.get("title_en", ""),
-                        "category_nm": doc.get("category_nm", ""),
-                        "dept_nm": doc.get("dept_nm", ""),
-                        "org_nm": doc.get("org_nm", ""),
-                        "keywords": doc.get("keywords", []),
-                        "desc": doc.get("desc", ""),
-                        "data_format": doc.get("data_format", ""),
-                        "api_type": doc.get("api_type", ""),
-                        "data_type": "API",
-                    }
-                    api_count += 1
-                else:
-                    es_doc = {
-                        "list_id": doc.get("list_id"),
-                        "list_title": doc.get("list_title", ""),
-                        "title": doc.get("title", ""),
-                        "category_nm": doc.get("new_category_nm", ""),
-                        "dept_nm": doc.get("dept_nm", ""),
-                        "org_nm": doc.get("org_nm", ""),
-                        "keywords": doc.get("keywords", []),
-                        "desc": doc.get("desc", ""),
-                        "data_format": doc.get("data_type", ""),
-                        "api_type": "FILE",
-                        "data_type": "FILE",
-                    }
-                    file_count += 1
-
-                self.es.index(
-                    index=self.index_name,
-                    id=doc.get("list_id"),
-                    document=es_doc,
+            api_sources = [
+                dict(
+                    zip(_SOURCE_KEYS, _api_fields({**_API_DEFAULTS, **doc})),
+                    data_type="API",
+                )
+                for doc in api_docs
+            ]
+            file_sources = [
+                dict(
+                    zip(
+                        _SOURCE_KEYS,
+                        (*_file_fields({**_FILE_DEFAULTS, **doc}), "FILE"),
+                    ),
+                    data_type="FILE",
                 )
+                for doc in file_docs
+            ]
 
-            self.es.indices.refresh(index=self.index_name)
-            logger.info(
-                f"인덱싱 완료! API: {api_count}개, "
-                f"File: {file_count}개, 총 {len(documents)}개"
-            )
+            body = bytearray()
+            for es_doc in chain(api_sources, file_sources):
+                body += _dumps({"index": {"_id": es_doc["list_id"]}})
+                body += b"\n"
+                body += _dumps(es_doc)
+                body += b"\n"
+
+            if body:
+                response = self.es.bulk(
+                    index=self.index_name, operations=bytes(body)
+                )
+                if response["errors"]:
+                    failed = [
+                        item["index"]
+                        for item in response["items"]
+                        if "error" in item["index"]
+                    ]
+                    logger.error(f"인덱싱 실패한 문서: {failed}")
+                    raise Exception(f"인덱싱 실패한 문서: {failed}")
+            return len(api_sources), len(file_sources)
         except Exception as e:
             logger.error(f"문서 인덱싱 중 오류 발생: {e}")
             raise
@@ -230,22 +336,42 @@ class TitleIndexer:
         mongo_client = None
         try:
             mongo_client = await self.initialize_beanie()
+            self.create_elasticsearch_index()
 
-            api_documents = await self.get_all_open_api_info()
-            logger.info(f"API 데이터 {len(api_documents)}개 조회 완료")
+            api_count = 0
+            file_count = 0
+            batch: list[dict[str, Any]] = []
 
-            file_documents = await self.get_all_open_file_info()
-            logger.info(f"File 데이터 {len(file_documents)}개 조회 완료")
+            self.es.indices.put_settings(
+                index=self.index_name, settings=_BULK_LOAD_SETTINGS
+            )
+            try:
+                async for doc in self.iter_all_documents():
+                    batch.append(doc)
+                    if len(batch) >= _INDEX_BATCH_SIZE:
+                        indexed_api, indexed_file = self.index_documents(batch)
+                        api_count += indexed_api
+                        file_count += indexed_file
+                        batch = []
 
-            all_documents = api_documents + file_documents
+                if batch:
+                    indexed_api, indexed_file = self.index_documents(batch)
+                    api_count += indexed_api
+                    file_count += indexed_file
+            finally:
+                self.es.indices.put_settings(
+                    index=self.index_name, settings=_DEFAULT_INDEX_SETTINGS
+                )
+
+            self.es.indices.refresh(index=self.index_name)
+            self.es.indices.forcemerge(
+                index=self.index_name, max_num_segments=1
+            )
             logger.info(
-                f"총 {len(all_documents)}개의 문서 "
-                f"(API: {len(api_documents)}, File: {len(file_documents)})"
+                f"인덱싱 완료! API: {api_count}개, "
+                f"File: {file_count}개, 총 {api_count + file_count}개"
             )
 
-            self.create_elasticsearch_index()
-            self.index_documents(all_documents)
-
             stats = self.es.indices.stats(index=self.index_name)
             total_docs = stats["indices"][self.index_name]["total"]["docs"][
                 "count"
@@ -268,4 +394,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
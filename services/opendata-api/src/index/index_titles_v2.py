@@ -13,15 +13,203 @@
 # limitations under the License.
 import asyncio
 import logging
-from typing import Any
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, AsyncIterator
 
-from elasticsearch import Elasticsearch
+logger = logging.getLogger(__name__)
 
-from core.settings import get_settings
-from models import OpenAPIInfo, OpenFileInfo
+SYNONYM_FILE_PATH = "synonyms.txt"
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+_INDEX_MAPPING = MappingProxyType(
+    {
+        "mappings": {
+            "properties": {
+                # 핵심 검색 필드 1: 목록 제목 (한글)
+                "list_title": {
+                    "type": "text",
+                    "analyzer": "nori_analyzer",
+                    "search_analyzer": "nori_analyzer",
+                    "fields": {
+                        "keyword": {
+                            "type": "keyword",
+                            "ignore_above": 256,
+                        },
+                        "ngram": {
+                            "type": "text",
+                            "analyzer": "ngram_analyzer",
+                        },
+                    },
+                },
+                "list_id": {"type": "integer"},
+                # 핵심 검색 필드 2: 제목 (영문/한글)
+                "title": {
+                    "type": "text",
+                    "analyzer": "english_analyzer",
+                    "search_analyzer": "english_analyzer",
+                    "fields": {
+                        "keyword": {
+                            "type": "keyword",
+                            "ignore_above": 256,
+                        },
+                        "korean": {
+                            "type": "text",
+                            "analyzer": "nori_analyzer",
+                        },
+                    },
+                },
+                # 필터/태그 검색용 (낮은 가중치)
+                "category_nm": {"type": "keyword"},
+                "dept_nm": {"type": "keyword"},
+                "org_nm": {
+                    "type": "text",
+                    "analyzer": "nori_analyzer",
+                    "search_analyzer": "nori_analyzer",
+                },
+                # 핵심 검색 필드 3: 키워드 배열
+                "keywords": {"type": "keyword"},
+                # 핵심 검색 필드 4: 설명 (한글)
+                "desc": {
+                    "type": "text",
+                    "analyzer": "nori_analyzer",
+                    "search_analyzer": "nori_analyzer",
+                },
+                "data_format": {"type": "keyword"},
+                "api_type": {"type": "keyword"},
+                "data_type": {"type": "keyword"},
+            }
+        },
+        "settings": {
+            "analysis": {
+                "analyzer": {
+                    "nori_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "nori_tokenizer",
+                        "filter": [
+                            "nori_readingform",
+                            "lowercase",
+                            "trim",
+                            "my_synonym_filter",
+                        ],
+                    },
+                    "english_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "standard",
+                        "filter": [
+                            "lowercase",
+                            "english_stop",
+                            "english_stemmer",
+                            "trim",
+                        ],
+                    },
+                    "ngram_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "standard",
+                        "filter": ["lowercase", "ngram_filter"],
+                    },
+                },
+                "filter": {
+                    "my_synonym_filter": {
+                        "type": "synonym",
+                        "synonyms": SYNONYM_FILE_PATH,
+                    },
+                    "ngram_filter": {
+                        "type": "ngram",
+                        "min_gram": 2,
+                        "max_gram": 50,
+                    },
+                    "english_stop": {
+                        "type": "stop",
+                        "stopwords": "_english_",
+                    },
+                    "english_stemmer": {
+                        "type": "stemmer",
+                        "language": "english",
+                    },
+                },
+            },
+            "index": {"max_ngram_diff": 50},
+        },
+    }
+)
+
+_BULK_LOAD_SETTINGS = {
+    "index": {"refresh_interval": "-1", "number_of_replicas": 0}
+}
+_DEFAULT_INDEX_SETTINGS = {
+    "index": {"refresh_interval": None, "number_of_replicas": None}
+}
+
+_INDEX_BATCH_SIZE = 1000
+
+_API_PROJECTION = {
+    "_id": 0,
+    "list_id": 1,
+    "list_title": 1,
+    "title_en": 1,
+    "category_nm": 1,
+    "dept_nm": 1,
+    "org_nm": 1,
+    "keywords": 1,
+    "desc": 1,
+    "data_format": 1,
+    "api_type": 1,
+    "request_cnt": 1,
+}
+
+_FILE_PROJECTION = {
+    "_id": 0,
+    "list_id": 1,
+    "list_title": 1,
+    "title": 1,
+    "new_category_nm": 1,
+    "dept_nm": 1,
+    "org_nm": 1,
+    "keywords": 1,
+    "desc": 1,
+    "data_type": 1,
+}
+
+_SOURCE_KEYS = (
+    "list_id",
+    "list_title",
+    "title",
+    "category_nm",
+    "dept_nm",
+    "org_nm",
+    "keywords",
+    "desc",
+    "data_format",
+    "api_type",
+)
+
+_API_DEFAULTS = {
+    "list_id": None,
+    "list_title": "",
+    "title_en": "",
+    "category_nm": "",
+    "dept_nm": "",
+    "org_nm": "",
+    "keywords": [],
+    "desc": "",
+    "data_format": "",
+    "api_type": "",
+}
+_api_fields = itemgetter(*_API_DEFAULTS)
+
+_FILE_DEFAULTS = {
+    "list_id": None,
+    "list_title": "",
+    "title": "",
+    "new_category_nm": "",
+    "dept_nm": "",
+    "org_nm": "",
+    "keywords": [],
+    "desc": "",
+    "data_type": "",
+}
+_file_fields = itemgetter(*_FILE_DEFAULTS)
 
 
 class TitleIndexer:
@@ -30,43 +218,62 @@ class TitleIndexer:
         mongo_uri: str | None = None,
         es_hosts: list[str] | None = None,
     ):
-        settings = get_settings()
+        from core.clients import get_es_client
+        from core.settings import get_infra_settings
+
+        settings = get_infra_settings()
         if mongo_uri is None:
             mongo_uri = settings.MONGO_URL
         if es_hosts is None:
             es_hosts = [settings.ELASTICSEARCH_URL]
 
         self.mongo_uri = mongo_uri
-        self.es = Elasticsearch(hosts=es_hosts)
+        self.mongo_db = None
+        self.es = get_es_client(*es_hosts)
         self.index_name = settings.ELASTICSEARCH_INDEX_NAME
 
     async def initialize_beanie(self):
         from beanie import init_beanie
         from motor.motor_asyncio import AsyncIOMotorClient
 
+        from models import OpenAPIInfo, OpenFileInfo
+
         mongo_client = AsyncIOMotorClient(self.mongo_uri)
         await init_beanie(
             database=mongo_client.open_data,
             document_models=[OpenAPIInfo, OpenFileInfo],
         )
+        self.mongo_db = mongo_client.open_data
         return mongo_client
 
-    async def get_all_open_api_info(self) -> list[dict[str, Any]]:
+    async def iter_open_api_info(self) -> AsyncIterator[dict[str, Any]]:
+        from models import OpenAPIInfo
+
         try:
-            documents = await OpenAPIInfo.find_all().to_list()
-            return [doc.model_dump() for doc in documents]
+            collection = self.mongo_db[OpenAPIInfo.Settings.name]
+            async for doc in collection.find({}, _API_PROJECTION):
+                yield doc
         except Exception as e:
             logger.error(f"OpenAPIInfo 조회 중 오류 발생: {e}")
             raise
 
-    async def get_all_open_file_info(self) -> list[dict[str, Any]]:
+    async def iter_open_file_info(self) -> AsyncIterator[dict[str, Any]]:
+        from models import OpenFileInfo
+
         try:
-            documents = await OpenFileInfo.find_all().to_list()
-            return [doc.model_dump() for doc in documents]
+            collection = self.mongo_db[OpenFileInfo.Settings.name]
+            async for doc in collection.find({}, _FILE_PROJECTION):
+                yield doc
         except Exception as e:
             logger.error(f"OpenFileInfo 조회 중 오류 발생: {e}")
             raise
 
+    async def iter_all_documents(self) -> AsyncIterator[dict[str, Any]]:
+        async for doc in self.iter_open_api_info():
+            yield doc
+        async for doc in self.iter_open_file_info():
+            yield doc
+
     def create_elasticsearch_index(self):
         """
         Elasticsearch 인덱스 생성 및 매핑 설정
@@ -75,184 +282,60 @@ class TitleIndexer:
         - 핵심 검색 필드 (높은 가중치): list_title, title, desc, keywords
         - 필터/태그 검색 (낮은 가중치): category_nm
         """
-        SYNONYM_FILE_PATH = "synonyms.txt"
-        mapping = {
-            "mappings": {
-                "properties": {
-                    # 핵심 검색 필드 1: 목록 제목 (한글)
-                    "list_title": {
-                        "type": "text",
-                        "analyzer": "nori_analyzer",
-                        "search_analyzer": "nori_analyzer",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword",
-                                "ignore_above": 256,
-                            },
-                            "ngram": {
-                                "type": "text",
-                                "analyzer": "ngram_analyzer",
-                            },
-                        },
-                    },
-                    "list_id": {"type": "integer"},
-                    # 핵심 검색 필드 2: 제목 (영문/한글)
-                    "title": {
-                        "type": "text",
-                        "analyzer": "english_analyzer",
-                        "search_analyzer": "english_analyzer",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword",
-                                "ignore_above": 256,
-                            },
-                            "korean": {
-                                "type": "text",
-                                "analyzer": "nori_analyzer",
-                            },
-                        },
-                    },
-                    # 필터/태그 검색용 (낮은 가중치)
-                    "category_nm": {"type": "keyword"},
-                    "dept_nm": {"type": "keyword"},
-                    "org_nm": {
-                        "type": "text",
-                        "analyzer": "nori_analyzer",
-                        "search_analyzer": "nori_analyzer",
-                    },
-                    # 핵심 검색 필드 3: 키워드 배열
-                    "keywords": {"type": "keyword"},
-                    # 핵심 검색 필드 4: 설명 (한글)
-                    "desc": {
-                        "type": "text",
-                        "analyzer": "nori_analyzer",
-                        "search_analyzer": "nori_analyzer",
-                    },
-                    "data_format": {"type": "keyword"},
-                    "api_type": {"type": "keyword"},
-                    "data_type": {"type": "keyword"},
-                }
-            },
-            "settings": {
-                "analysis": {
-                    "analyzer": {
-                        "nori_analyzer": {
-                            "type": "custom",
-                            "tokenizer": "nori_tokenizer",
-                            "filter": [
-                                "nori_readingform",
-                                "lowercase",
-                                "trim",
-                                "my_synonym_filter",
-                            ],
-                        },
-                        "english_analyzer": {
-                            "type": "custom",
-                            "tokenizer": "standard",
-                            "filter": [
-                                "lowercase",
-                                "english_stop",
-                                "english_stemmer",
-                                "trim",
-                            ],
-                        },
-                        "ngram_analyzer": {
-                            "type": "custom",
-                            "tokenizer": "standard",
-                            "filter": ["lowercase", "ngram_filter"],
-                        },
-                    },
-                    "filter": {
-                        "my_synonym_filter": {
-                            "type": "synonym",
-                            "synonyms": SYNONYM_FILE_PATH,
-                        },
-                        "ngram_filter": {
-                            "type": "ngram",
-                            "min_gram": 2,
-                            "max_gram": 50,
-                        },
-                        "english_stop": {
-                            "type": "stop",
-                            "stopwords": "_english_",
-                        },
-                        "english_stemmer": {
-                            "type": "stemmer",
-                            "language": "english",
-                        },
-                    },
-                },
-                "index": {"max_ngram_diff": 50},
-            },
-        }
 
         try:
             if self.es.indices.exists(index=self.index_name):
                 self.es.indices.delete(index=self.index_name)
                 logger.warning(f"기존 인덱스 '{self.index_name}' 삭제 완료.")
 
-            self.es.indices.create(index=self.index_name, **mapping)
+            self.es.indices.create(index=self.index_name, **_INDEX_MAPPING)
             logger.info(f"새로운 인덱스 '{self.index_name}' 및 튜닝된 분석기 생성 완료.")
         except Exception as e:
             logger.error(f"인덱스 생성 중 오류 발생: {e}")
             raise
 
-    def index_documents(self, documents: list[dict[str, Any]]):
+    def index_documents(
+        self, documents: list[dict[str, Any]]
+    ) -> tuple[int, int]:
         try:
             from elasticsearch.helpers import bulk
-            actions = []
-            api_count = 0
-            file_count = 0
 
-            for doc in documents:
-                if "request_cnt" in doc:
-                    es_doc = {
-                        "list_id": doc.get("list_id"),
-                        "list_title": doc.get("list_title", ""),
-                        "title": doc.get("title_en", ""),
-                        "category_nm": doc.get("category_nm", ""),
-                        "dept_nm": doc.get("dept_nm", ""),
-                        "org_nm": doc.get("org_nm", ""),
-                        "keywords": doc.get("keywords", []),
-                        "desc": doc.get("desc", ""),
-                        "data_format": doc.get("data_format", ""),
-                        "api_type": doc.get("api_type", ""),
-                        "data_type": "API",
-                    }
-                    api_count += 1
-                else:
-                    es_doc = {
-                        "list_id": doc.get("list_id"),
-                        "list_title": doc.get("list_title", ""),
-                        "title": doc.get("title", ""),
-                        "category_nm": doc.get("new_category_nm", ""),
-                        "dept_nm": doc.get("dept_nm", ""),
-                        "org_nm": doc.get("org_nm", ""),
-                        "keywords": doc.get("keywords", []),
-                        "desc": doc.get("desc", ""),
-                        "data_format": doc.get("data_type", ""),
-                        "api_type": "FILE",
-                        "data_type": "FILE",
-                    }
-                    file_count += 1
-
-                actions.append({
-                    '_index': self.index_name,
-                    '_id': doc.get("list_id"),
-                    '_source': es_doc,
-                })
+            api_docs = [doc for doc in documents if "request_cnt" in doc]
+            file_docs = [doc for doc in documents if "request_cnt" not in doc]
 
-            success, failed = bulk(self.es, actions)
+            api_sources = [
+                dict(
+                    zip(_SOURCE_KEYS, _api_fields({**_API_DEFAULTS, **doc})),
+                    data_type="API",
+                )
+                for doc in api_docs
+            ]
+            file_sources = [
+                dict(
+                    zip(
+                        _SOURCE_KEYS,
+                        (*_file_fields({**_FILE_DEFAULTS, **doc}), "FILE"),
+                    ),
+                    data_type="FILE",
+                )
+                for doc in file_docs
+            ]
 
-            self.es.indices.refresh(index=self.index_name)
-            logger.info(
-                f"인덱싱 완료! API: {api_count}개, "
-                f"File: {file_count}개, 총 {len(documents)}개"
-            )
+            actions = [
+                {
+                    "_index": self.index_name,
+                    "_id": es_doc["list_id"],
+                    "_source": es_doc,
+                }
+                for es_doc in chain(api_sources, file_sources)
+            ]
+
+            success, failed = bulk(self.es, actions)
 
             if failed:
                 logger.error(f"인덱싱 실패한 문서: {failed}")
                 raise Exception(f"인덱싱 실패한 문서: {failed}")
+            return len(api_sources), len(file_sources)
         except Exception as e:
             logger.error(f"문서 인덱싱 중 오류 발생: {e}")
             raise
@@ -261,22 +344,42 @@ class TitleIndexer:
         mongo_client = None
         try:
             mongo_client = await self.initialize_beanie()
+            self.create_elasticsearch_index()
 
-            api_documents = await self.get_all_open_api_info()
-            logger.info(f"API 데이터 {len(api_documents)}개 조회 완료")
+            api_count = 0
+            file_count = 0
+            batch: list[dict[str, Any]] = []
 
-            file_documents = await self.get_all_open_file_info()
-            logger.info(f"File 데이터 {len(file_documents)}개 조회 완료")
+            self.es.indices.put_settings(
+                index=self.index_name, settings=_BULK_LOAD_SETTINGS
+            )
+            try:
+                async for doc in self.iter_all_documents():
+                    batch.append(doc)
+                    if len(batch) >= _INDEX_BATCH_SIZE:
+                        indexed_api, indexed_file = self.index_documents(batch)
+                        api_count += indexed_api
+                        file_count += indexed_file
+                        batch = []
 
-            all_documents = api_documents + file_documents
+                if batch:
+                    indexed_api, indexed_file = self.index_documents(batch)
+                    api_count += indexed_api
+                    file_count += indexed_file
+            finally:
+                self.es.indices.put_settings(
+                    index=self.index_name, settings=_DEFAULT_INDEX_SETTINGS
+                )
+
+            self.es.indices.refresh(index=self.index_name)
+            self.es.indices.forcemerge(
+                index=self.index_name, max_num_segments=1
+            )
             logger.info(
-                f"총 {len(all_documents)}개의 문서 "
-                f"(API: {len(api_documents)}, File: {len(file_documents)})"
+                f"인덱싱 완료! API: {api_count}개, "
+                f"File: {file_count}개, 총 {api_count + file_count}개"
             )
 
-            self.create_elasticsearch_index()
-            self.index_documents(all_documents)
-
             stats = self.es.indices.stats(index=self.index_name)
             total_docs = stats["indices"][self.index_name]["total"]["docs"][
                 "count"
@@ -299,4 +402,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
@@ -11,10 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 from typing import Any
 
 import uvicorn
 from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBasic
 from slowapi.errors import RateLimitExceeded
 from starlette.middleware.cors import CORSMiddleware
@@ -55,6 +57,7 @@ app = FastAPI(
     redoc_url="/redoc" if settings.enable_redoc else None,
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.state.limiter = limiter
@@ -80,15 +83,22 @@ app.include_router(
 
 security = HTTPBasic()
 
+_HEALTH_RESPONSE = Response(
+    content=json.dumps(
+        {
+            "status": "ok",
+            "service": "core-server",
+            "version": settings.version,
+            "environment": settings.env,
+        }
+    ),
+    media_type="application/json",
+)
+
 
 @app.get("/health")
-async def health_check() -> dict[str, Any]:
-    return {
-        "status": "ok",
-        "service": "core-server",
-        "version": settings.version,
-        "environment": settings.env,
-    }
+async def health_check() -> Response:
+    return _HEALTH_RESPONSE
 
 
 @app.get("/health/services")
@@ -115,5 +125,7 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         log_level=settings.log_level.lower(),
-        access_log=True,
+        access_log=not settings.is_production,
+        loop="auto",
+        http="auto",
     )
@@ -25,6 +25,8 @@ from .open_data import (
     RankMetadata,
     SavedRequest,
     DocRecommendation,
+    construct_from_mongo,
+    find_trusted,
 )
 
 __all__ = [
@@ -41,4 +43,6 @@ __all__ = [
     "RankMetadata",
     "SavedRequest",
     "DocRecommendation",
+    "construct_from_mongo",
+    "find_trusted",
 ]
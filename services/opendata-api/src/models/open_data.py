@@ -12,14 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, Literal, TypeVar
 
 import pymongo
 from beanie import Document
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ParsedEndpoint(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     path: str
     method: str
@@ -73,9 +75,6 @@ class OpenFileInfo(Document):
         name = "open_file_info"
         indexes = [
             "title",
-            "list_id",
-            "org_nm",
-            [("list_id", pymongo.ASCENDING)],
             [("download_cnt", pymongo.DESCENDING)],
             [("updated_at", pymongo.DESCENDING)],
             [("list_title", pymongo.ASCENDING)],
@@ -155,10 +154,8 @@ class OpenAPIInfo(Document):
         name = "open_data_info"
         indexes = [
             "title",
-            "list_id",
             "detail_format",
             "is_parsed",
-            [("list_id", pymongo.ASCENDING)],
             [("request_cnt", pymongo.DESCENDING)],
             [("updated_at", pymongo.DESCENDING)],
             [("list_title", pymongo.ASCENDING)],
@@ -281,8 +278,6 @@ class GeneratedAPIDocs(Document):
     class Settings:
         name = "generated_api_docs"
         indexes = [
-            "list_id",
-            [("list_id", pymongo.ASCENDING)],
             [("token_count", pymongo.DESCENDING)],
             [("generated_at", pymongo.DESCENDING)],
             [
@@ -308,8 +303,6 @@ class GeneratedFileDocs(Document):
     class Settings:
         name = "generated_file_docs"
         indexes = [
-            "list_id",
-            [("list_id", pymongo.ASCENDING)],
             [("token_count", pymongo.DESCENDING)],
             [("generated_at", pymongo.DESCENDING)],
             [
@@ -405,23 +398,19 @@ class RankMetadata(Document):
         ]
 
 
-class RecommendationItem(BaseModel):
-    """추천 아이템 모델"""
-
-    doc_id: str
-    doc_type: str
-    similarity_score: float
-    rank: int
-
-
 class DocRecommendation(Document):
     """문서 추천 모델"""
 
     target_doc_id: str
     target_doc_type: str
-    recommendations: list[RecommendationItem]
+    # 추천 목록을 순위 순서의 병렬 배열로 저장 (rank = 인덱스 + 1)
+    doc_ids: list[str] = Field(default_factory=list)
+    doc_types: list[str] = Field(default_factory=list)
+    # 유사도 점수 x 10000 정수값
+    scores: list[int] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
+    expires_at: datetime | None = None
     version: int = 1
 
     class Settings:
@@ -437,3 +426,28 @@ class DocRecommendation(Document):
                 ("target_doc_type", pymongo.ASCENDING),
             ],
         ]
+
+
+DocumentT = TypeVar("DocumentT", bound=Document)
+
+
+def construct_from_mongo(
+    model_cls: type[DocumentT], raw: dict[str, Any]
+) -> DocumentT:
+    """저장 시 이미 검증된 Mongo 문서를 검증 없이 모델로 복원
+
+    _id는 변환 없이 그대로 넘겨 모델의 id 타입(ObjectId 등)을 유지한다.
+    """
+    if "_id" in raw:
+        raw["id"] = raw.pop("_id")
+    return model_cls.model_construct(**raw)
+
+
+async def find_trusted(
+    model_cls: type[DocumentT], query: dict[str, Any], validate: bool = False
+) -> list[DocumentT]:
+    """읽기 전용 경로에서 문서를 조회. validate=False면 검증을 생략"""
+    if validate:
+        return await model_cls.find(query).to_list()
+    cursor = model_cls.get_pymongo_collection().find(query)
+    return [construct_from_mongo(model_cls, raw) async for raw in cursor]
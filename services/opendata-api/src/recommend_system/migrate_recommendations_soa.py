@@ -0,0 +1,58 @@
+# Copyright 2025 Team Aeris
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+
+from core.settings import get_infra_settings
+from db.mongo import MongoDB
+from models import DocRecommendation
+from recommend_system.recommend_core import SCORE_SCALE
+
+
+async def main():
+    """기존 recommendations 서브문서 배열을 병렬 배열 필드로 일괄 변환"""
+    settings = get_infra_settings()
+    await MongoDB.init(settings.MONGO_URL, settings.MONGO_DB)
+
+    # 파이프라인 업데이트로 서버에서 바로 변환하여 문서를 내려받지 않음
+    result = await DocRecommendation.get_pymongo_collection().update_many(
+        {"recommendations": {"$exists": True}},
+        [
+            {
+                "$set": {
+                    "doc_ids": "$recommendations.doc_id",
+                    "doc_types": "$recommendations.doc_type",
+                    "scores": {
+                        "$map": {
+                            "input": "$recommendations.similarity_score",
+                            "in": {
+                                "$toInt": {
+                                    "$round": [
+                                        {"$multiply": ["$$this", SCORE_SCALE]},
+                                        0,
+                                    ]
+                                }
+                            },
+                        }
+                    },
+                }
+            },
+            {"$unset": "recommendations"},
+        ],
+    )
+
+    print(f"추천 문서 변환 완료: {result.modified_count}개")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -11,27 +11,42 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
 from typing import Any
 
 import numpy as np
 from pymilvus import Collection, MilvusClient
 
+from recommend_system.recommend_core import l2_normalize
+
+logger = logging.getLogger(__name__)
+
+DELETE_CHUNK_SIZE = 512
+
+# 문자열 보간 대신 파라미터 바인딩 필터 사용
+_DOC_ID_EXPR = "doc_id == {doc_id}"
+_DOC_IDS_EXPR = "doc_id in {doc_ids}"
+
 
 def get_vector_by_doc_id(collection: Collection, doc_id: str) -> dict | None:
     """특정 문서 ID로 벡터와 메타데이터를 조회"""
     try:
-        expr = f'doc_id == "{doc_id}"'
-        results = collection.query(expr, output_fields=["doc_id", "embedding"])
+        results = collection.query(
+            _DOC_ID_EXPR,
+            expr_params={"doc_id": doc_id},
+            output_fields=["doc_id", "vector"],
+            consistency_level="Eventually",
+        )
 
         if results:
-            print(f"문서 '{doc_id}' 조회 완료")
+            logger.debug("문서 '%s' 조회 완료", doc_id)
             return results[0]
         else:
-            print(f"문서 '{doc_id}'를 찾을 수 없습니다")
+            logger.debug("문서 '%s'를 찾을 수 없습니다", doc_id)
             return None
 
     except Exception as e:
-        print(f"문서 조회 실패: {e}")
+        logger.error("문서 조회 실패: %s", e)
         raise
 
 
@@ -40,56 +55,74 @@ def update_vector_by_doc_id(
 ) -> bool:
     """특정 문서의 임베딩 벡터를 업데이트"""
     try:
-        collection.delete(f'doc_id == "{doc_id}"')
-        print(f"문서 '{doc_id}' 기존 데이터 삭제 완료")
+        collection.delete(_DOC_ID_EXPR, expr_params={"doc_id": doc_id})
+        logger.debug("문서 '%s' 기존 데이터 삭제 완료", doc_id)
 
-        entities = [[doc_id], [new_embedding.tolist()]]
+        entities = [[doc_id], [l2_normalize(new_embedding).tolist()]]
         collection.insert(entities)
-        collection.flush()
 
-        print(f"문서 '{doc_id}' 업데이트 완료")
+        logger.debug("문서 '%s' 업데이트 완료", doc_id)
         return True
 
     except Exception as e:
-        print(f"문서 업데이트 실패: {e}")
+        logger.error("문서 업데이트 실패: %s", e)
         return False
 
 
-def delete_vector_by_doc_id(collection: Collection, doc_id: str) -> bool:
-    """특정 문서를 삭제"""
+def delete_vector_by_doc_id(
+    collection: Collection, doc_id: str, check: bool = False
+) -> bool:
+    """특정 문서를 삭제
+
+    기본 반환값 True는 삭제 요청이 수행되었다는 뜻일 뿐이다. Milvus는
+    기본키 삭제 시 존재 여부와 무관하게 delete_count를 채우므로, 문서
+    존재 여부가 필요하면 check=True로 호출한다.
+    """
     try:
-        existing = get_vector_by_doc_id(collection, doc_id)
-        if not existing:
-            print(f"삭제할 문서 '{doc_id}'가 존재하지 않습니다")
+        expr_params = {"doc_id": doc_id}
+        if check and not collection.query(
+            _DOC_ID_EXPR,
+            expr_params=expr_params,
+            output_fields=["doc_id"],
+            limit=1,
+            consistency_level="Eventually",
+        ):
+            logger.debug("삭제할 문서 '%s'가 존재하지 않습니다", doc_id)
             return False
 
-        collection.delete(f'doc_id == "{doc_id}"')
-        collection.flush()
+        collection.delete(_DOC_ID_EXPR, expr_params=expr_params)
 
-        print(f"문서 '{doc_id}' 삭제 완료")
+        logger.debug("문서 '%s' 삭제 완료", doc_id)
         return True
 
     except Exception as e:
-        print(f"문서 삭제 실패: {e}")
+        logger.error("문서 삭제 실패: %s", e)
         return False
 
 
+def flush_now(collection: Collection) -> None:
+    """단건 변경을 연속으로 수행한 뒤 한 번에 flush"""
+    collection.flush()
+    logger.debug("컬렉션 '%s' flush 완료", collection.name)
+
+
 def batch_delete_vectors(collection: Collection, doc_ids: list[str]) -> int:
     """여러 문서를 일괄 삭제"""
     try:
         if not doc_ids:
-            print("삭제할 문서 ID가 없습니다")
+            logger.debug("삭제할 문서 ID가 없습니다")
             return 0
 
-        expr = f"doc_id in {doc_ids}"
-        collection.delete(expr)
+        for i in range(0, len(doc_ids), DELETE_CHUNK_SIZE):
+            chunk = doc_ids[i : i + DELETE_CHUNK_SIZE]
+            collection.delete(_DOC_IDS_EXPR, expr_params={"doc_ids": chunk})
         collection.flush()
 
-        print(f"{len(doc_ids)}개 문서 일괄 삭제 완료")
+        logger.info("%d개 문서 일괄 삭제 완료", len(doc_ids))
         return len(doc_ids)
 
     except Exception as e:
-        print(f"일괄 삭제 실패: {e}")
+        logger.error("일괄 삭제 실패: %s", e)
         return 0
 
 
@@ -117,9 +150,9 @@ def get_collection_stats(
                 "schema": collection.schema,
             }
 
-        print("컬렉션 통계 조회 완료")
+        logger.debug("컬렉션 통계 조회 완료")
         return stats
 
     except Exception as e:
-        print(f"통계 조회 실패: {e}")
+        logger.error("통계 조회 실패: %s", e)
         return {}
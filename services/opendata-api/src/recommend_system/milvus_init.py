@@ -11,24 +11,35 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import logging
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from typing import Any
 
 import numpy as np
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymilvus import DataType, Function, FunctionType, MilvusClient
-from pymongo import MongoClient
 from sentence_transformers import SentenceTransformer
 
-from core.settings import get_settings
+from core.settings import get_infra_settings
+from recommend_system.recommend_core import l2_normalize
+
+logger = logging.getLogger(__name__)
 
 
 def init_milvus_collection(col_name: str, dim: int) -> MilvusClient:
     """Milvus 컬렉션을 초기화하고 인덱스를 생성"""
     try:
-        client = MilvusClient(uri=get_settings().MILVUS_URL)
-        print("Milvus 연결 완료")
+        client = MilvusClient(uri=get_infra_settings().MILVUS_URL)
+        logger.info("Milvus 연결 완료")
 
         if client.has_collection(collection_name=col_name):
-            print(f"기존 컬렉션 '{col_name}' 삭제 중...")
+            logger.info("기존 컬렉션 '%s' 삭제 중...", col_name)
             client.drop_collection(collection_name=col_name)
 
         schema = client.create_schema(
@@ -64,20 +75,14 @@ def init_milvus_collection(col_name: str, dim: int) -> MilvusClient:
         schema.add_function(bm25_function)
 
         client.create_collection(collection_name=col_name, schema=schema)
-        print(f"컬렉션 '{col_name}' 생성 완료")
+        logger.info("컬렉션 '%s' 생성 완료", col_name)
 
         index_params = MilvusClient.prepare_index_params()
         index_params.add_index(
-            field_name="vector_ivf",
-            index_type="FLAT",
-            metric_type="COSINE",
-            params={"nlist": 128, 'nprobe': 64},
-        )
-        index_params.add_index(
-            field_name="vector_hnsw",
-            index_type="HNSW",
-            metric_type="COSINE",
-            params={"M": 32, "efConstruction": 100, 'ef': 128},
+            field_name="vector",
+            index_type="HNSW_SQ",
+            metric_type="IP",
+            params={"M": 16, "efConstruction": 200, "sq_type": "SQ8"},
         )
 
         client.create_index(
@@ -85,11 +90,11 @@ def init_milvus_collection(col_name: str, dim: int) -> MilvusClient:
             index_params=index_params,
         )
         client.load_collection(collection_name=col_name)
-        print("컬렉션 로드 완료")
+        logger.info("컬렉션 로드 완료")
         return client
 
     except Exception as e:
-        print(f"Milvus 컬렉션 초기화 실패: {e}")
+        logger.error("Milvus 컬렉션 초기화 실패: %s", e)
         raise
 
 
@@ -99,88 +104,163 @@ def insert_vectors_milvus(
     doc_ids: list[str],
     embeddings: np.ndarray,
     contents: list[str],
-    batch_size: int = 50,
+    batch_size: int = 1024,
+    max_in_flight: int = 4,
 ) -> Any:
     """문서 ID와 임베딩 벡터를 Milvus에 배치로 삽입"""
     try:
         total_inserted = 0
 
-        for i in range(0, len(doc_ids), batch_size):
-            batch_ids = doc_ids[i:i + batch_size]
-            batch_embeddings = embeddings[i:i + batch_size]
-            batch_contents = contents[i:i + batch_size]
-
-            data = [
-                {"doc_id": doc_id, "vector": vec.tolist(), "content": content}
-                for doc_id, vec, content in zip(batch_ids, batch_embeddings, batch_contents)
-            ]
-
+        def _insert_batch(data: list[dict[str, Any]]) -> int:
             client.insert(collection_name=collection_name, data=data)
-            total_inserted += len(data)
-            print(f"배치 삽입 완료: {len(data)}개 (총 {total_inserted}개)")
+            return len(data)
+
+        completed_batches = 0
+
+        def _collect(done: set[Future]) -> None:
+            nonlocal total_inserted, completed_batches
+            for fut in done:
+                total_inserted += fut.result()
+                completed_batches += 1
+                if completed_batches % 10 == 0:
+                    logger.info("배치 삽입 진행: 총 %s개", total_inserted)
+
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            pending: set[Future] = set()
+            for i in range(0, len(doc_ids), batch_size):
+                batch_ids = doc_ids[i : i + batch_size]
+                batch_vectors = embeddings[i : i + batch_size].tolist()
+                batch_contents = contents[i : i + batch_size]
+
+                data = [
+                    {"doc_id": doc_id, "vector": vec, "content": content}
+                    for doc_id, vec, content in zip(
+                        batch_ids, batch_vectors, batch_contents
+                    )
+                ]
+
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(done)
+                pending.add(executor.submit(_insert_batch, data))
+
+            if pending:
+                done, _ = wait(pending)
+                _collect(done)
 
         client.flush(collection_name=collection_name)
-        print(f"모든 데이터 삽입 완료! 총 {total_inserted}개 문서")
+        logger.info("모든 데이터 삽입 완료! 총 %s개 문서", total_inserted)
         return total_inserted
 
     except Exception as e:
-        print(f"벡터 삽입 실패: {e}")
+        logger.error("벡터 삽입 실패: %s", e)
         raise
 
 
-def create_embedding_text(doc: dict) -> str:
-    """문서의 핵심 필드를 결합하여 임베딩용 텍스트를 생성"""
+def build_embedding_texts(docs: list[dict]) -> list[str]:
+    """문서 리스트 전체의 임베딩용 텍스트를 한 번에 생성"""
+    return [
+        f"{doc.get('list_title', '')}. {doc.get('desc', '')}. "
+        f"핵심키워드: {' '.join(doc.get('keywords', ()))}. "
+        f"기관: {doc.get('org_nm', '')}. "
+        f"카테고리: {doc.get('new_category_nm', '')}"
+        for doc in docs
+    ]
 
-    title = doc.get("list_title", "")
-    desc = doc.get("desc", "")
-    keywords = " ".join(doc.get("keywords", []))
-    org_nm = doc.get("org_nm", "")
-    category_nm = doc.get("new_category_nm", "")
 
-    embedding_text = f"{title}. {desc}. 핵심키워드: {keywords}. 기관: {org_nm}. 카테고리: {category_nm}"
+def load_embedding_model(model_name: str) -> SentenceTransformer:
+    """SentenceTransformer 모델을 로드하고 GPU가 있으면 FP16으로 올림"""
+    import torch
 
-    return embedding_text
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(model_name, device=device)
+    if device == "cuda":
+        torch.backends.cuda.matmul.allow_tf32 = True
+        model.half()
+    return model
 
 
-def emb_texts(model: SentenceTransformer, texts: list[str]) -> np.ndarray:
+def emb_texts(
+    model: SentenceTransformer, texts: list[str], batch_size: int = 256
+) -> np.ndarray:
     """SentenceTransformer를 사용하여 텍스트 리스트를 임베딩 벡터로 변환"""
     try:
+        # 같은 텍스트는 한 번만 인코딩하고 결과를 원래 순서로 펼침
+        unique_texts = list(dict.fromkeys(texts))
         res = model.encode(
-            texts, convert_to_numpy=True, show_progress_bar=True, batch_size=32
+            unique_texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=True,
         )
-        return res
+        # half 정밀도로 인코딩한 경우에도 float32에서 단위 노름을 보장
+        vectors = l2_normalize(res)
+        if len(unique_texts) == len(texts):
+            return vectors
+
+        position = {text: i for i, text in enumerate(unique_texts)}
+        return vectors[[position[text] for text in texts]]
     except Exception as e:
-        print(f"임베딩 생성 실패: {e}")
+        logger.error("임베딩 생성 실패: %s", e)
         raise
 
 
-def get_data():
-    settings = get_settings()
-    client = MongoClient(settings.MONGO_URL)
-
-    db = client["open_data"]
-    api_data = list(db["open_api_info"].find({}, {"_id": 0}))
-    file_data = list(db["open_file_info"].find({}, {"_id": 0}))
-    processed_data = []
-
-    for src, dtype in [(api_data, "API"), (file_data, "FILE")]:
-        for item in src:
-            processed_data.append({
-                "_id": str(item.get("list_id", "")),
-                "list_title": item.get("list_title", ""),
-                "desc": item.get("desc", ""),
-                "keywords": item.get("keywords", []),
-                "doc_type": dtype,
-            })
-
-    print(
-        f"총 {len(processed_data)}개 문서 로드 완료 "
-        f"(API: {len(api_data)}, File: {len(file_data)})"
+def _embedding_source_stage(doc_type: str) -> dict[str, Any]:
+    return {
+        "$project": {
+            "_id": {"$toString": {"$ifNull": ["$list_id", ""]}},
+            "list_title": {"$ifNull": ["$list_title", ""]},
+            "desc": {"$ifNull": ["$desc", ""]},
+            "keywords": {"$ifNull": ["$keywords", []]},
+            "doc_type": {"$literal": doc_type},
+        }
+    }
+
+
+_mongo_client: AsyncIOMotorClient | None = None
+
+
+def _get_mongo() -> AsyncIOMotorClient:
+    global _mongo_client
+    if _mongo_client is None:
+        _mongo_client = AsyncIOMotorClient(
+            get_infra_settings().MONGO_URL, maxPoolSize=50
+        )
+    return _mongo_client
+
+
+async def _load_embedding_sources(
+    dest: list[dict[str, Any]], coll_name: str, doc_type: str
+) -> int:
+    count = 0
+    cursor = _get_mongo()["open_data"][coll_name].aggregate(
+        [_embedding_source_stage(doc_type)], batchSize=1000
+    )
+    async for doc in cursor:
+        dest.append(doc)
+        count += 1
+    return count
+
+
+async def get_data():
+    processed_data: list[dict[str, Any]] = []
+    api_count, file_count = await asyncio.gather(
+        _load_embedding_sources(processed_data, "open_api_info", "API"),
+        _load_embedding_sources(processed_data, "open_file_info", "FILE"),
+    )
+
+    logger.info(
+        "총 %s개 문서 로드 완료 (API: %s, File: %s)",
+        len(processed_data),
+        api_count,
+        file_count,
     )
     return processed_data
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     sample_data: list[dict] = [
         {
             "_id": "doc_tour_01",
@@ -207,19 +287,20 @@ if __name__ == "__main__":
             "keywords": ["여행트렌드", "여가활동", "국민조사"],
         },
     ]
-    data = get_data()
+    data = asyncio.run(get_data())
 
     try:
         MODEL_NAME = "snunlp/KR-SBERT-V40K-klueNLI-augSTS"
         print(f"모델 로드 중: {MODEL_NAME}")
-        model = SentenceTransformer(MODEL_NAME)
+        model = load_embedding_model(MODEL_NAME)
         print("모델 로드 완료")
 
-        embedding_texts = [create_embedding_text(doc) for doc in data]
+        embedding_texts = build_embedding_texts(data)
         print(f"{len(embedding_texts)}개 임베딩 텍스트 생성 완료")
 
         embeddings = emb_texts(model, embedding_texts)
         import pickle
+
         with open("embeddings.pkl", "wb") as f:
             pickle.dump(embeddings, f)
 
@@ -233,9 +314,8 @@ if __name__ == "__main__":
             client,
             "recommendation_db_v2",
             [d["_id"] for d in data],
-            [create_embedding_text(d) for d in data],
             embeddings,
-            batch_size=50
+            embedding_texts,
         )
 
         print("모든 과정 완료!")
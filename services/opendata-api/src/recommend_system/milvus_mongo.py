@@ -12,17 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
-from datetime import datetime
-from typing import Any
+import logging
+from typing import Any, AsyncIterator
 
 import numpy as np
 from pymilvus import MilvusClient
 from tqdm import tqdm
 
-from core.settings import get_settings
+from core.settings import get_infra_settings
 from db.mongo import MongoDB
-from models import DocRecommendation, OpenAPIInfo, OpenFileInfo
-from models.open_data import RecommendationItem
+from models import OpenAPIInfo, OpenFileInfo
+from recommend_system.recommend_core import (
+    RECOMMEND_BATCH_SIZE,
+    load_all_vectors,
+    search_similar,
+    search_similar_batch,
+    upsert_recommendations_bulk,
+)
+
+logger = logging.getLogger(__name__)
+
+RECOMMEND_CONCURRENCY = 4
+DOCUMENT_CURSOR_BATCH_SIZE = 1000
+
+_DOCUMENT_PROJECTION = {
+    "_id": 0,
+    "list_id": 1,
+    "list_title": 1,
+    "title": 1,
+    "desc": 1,
+    "keywords": 1,
+}
 
 
 def recommend_similar_documents(
@@ -35,43 +55,17 @@ def recommend_similar_documents(
 ) -> list[dict[str, Any]]:
     """Milvus를 사용하여 유사한 문서를 추천"""
     try:
-        search_params = {"metric_type": "COSINE", "params": {"nprobe": 10}}
-
-        results = client.search(
-            collection_name=collection_name,
-            data=[target_embedding.tolist()],
-            anns_field="vector",
-            search_params=search_params,
-            limit=top_k + 5,
-            output_fields=["doc_id", "doc_type"],
+        return search_similar(
+            client,
+            collection_name,
+            target_embedding,
+            target_doc_id,
+            top_k,
+            threshold,
         )
 
-        recommendations = []
-
-        for hit in results[0]:
-            doc_id = hit.get("doc_id")
-            distance = hit.get("distance", 0)
-            similarity = float(distance)
-
-            if doc_id != target_doc_id and similarity >= threshold:
-                recommendations.append(
-                    {
-                        "doc_id": doc_id,
-                        "doc_type": hit.get("doc_type", "API"),
-                        "similarity_score": float(similarity),
-                    }
-                )
-
-        recommendations = sorted(
-            recommendations,
-            key=lambda x: x["similarity_score"],
-            reverse=True,
-        )[:top_k]
-
-        return recommendations
-
     except Exception as e:
-        print(f"문서 추천 실패: {e}")
+        logger.error("문서 추천 실패: %s", e)
         return []
 
 
@@ -82,135 +76,138 @@ async def store_recommendations_in_mongo(
 ) -> bool:
     """추천 결과를 MongoDB에 저장"""
     try:
-        recommendation_items = []
-        for i, rec in enumerate(recommendations):
-            item = RecommendationItem(
-                doc_id=rec["doc_id"],
-                doc_type=rec.get("doc_type", "API"),
-                similarity_score=rec["similarity_score"],
-                rank=i + 1,
-            )
-            recommendation_items.append(item)
-
-        existing_rec = await DocRecommendation.find_one(
-            DocRecommendation.target_doc_id == target_doc_id
+        await upsert_recommendations_bulk(
+            [(target_doc_id, target_doc_type, recommendations)]
         )
+        return True
 
-        now = datetime.utcnow()
-
-        if existing_rec:
-            existing_rec.recommendations = recommendation_items
-            existing_rec.updated_at = now
-            existing_rec.version += 1
-            await existing_rec.save()
-        else:
-            new_rec = DocRecommendation(
-                target_doc_id=target_doc_id,
-                target_doc_type=target_doc_type,
-                recommendations=recommendation_items,
-                created_at=now,
-                updated_at=now,
-                version=1,
-            )
-            await new_rec.save()
+    except Exception as e:
+        logger.error("MongoDB 저장 실패: %s", e)
+        return False
 
+
+async def store_recommendations_bulk(
+    items: list[tuple[str, str, list[dict[str, Any]]]],
+) -> bool:
+    """여러 문서의 추천 결과를 한 번의 bulk_write로 MongoDB에 저장"""
+    try:
+        await upsert_recommendations_bulk(items)
         return True
 
     except Exception as e:
-        print(f"MongoDB 저장 실패: {e}")
+        logger.error("MongoDB 일괄 저장 실패: %s", e)
         return False
 
 
-async def get_all_documents():
-    """모든 문서 데이터를 가져오는 함수 (Beanie ODM 사용)"""
-    api_docs = await OpenAPIInfo.find({}, projection_model=None).to_list()
-    file_docs = await OpenFileInfo.find({}, projection_model=None).to_list()
-
-    processed_data = []
-
-    for doc in file_docs:
-        processed_data.append(
-            {
-                "_id": int(doc.list_id) if doc.list_id else 0,
-                "list_title": getattr(doc, "list_title", None)
-                or getattr(doc, "title", None)
-                or "",
-                "desc": doc.desc or "",
-                "keywords": doc.keywords
-                if isinstance(doc.keywords, list)
-                else [],
-                "doc_type": "FILE",
-            }
+def _normalize_document(doc: dict[str, Any], doc_type: str) -> dict[str, Any]:
+    """원본 문서를 추천 생성용 dict로 정규화"""
+    list_id = doc.get("list_id")
+    keywords = doc.get("keywords")
+    if doc_type == "FILE":
+        list_id = int(list_id) if list_id else 0
+    return {
+        "_id": list_id,
+        "list_title": doc.get("list_title") or doc.get("title") or "",
+        "desc": doc.get("desc") or "",
+        "keywords": keywords if isinstance(keywords, list) else [],
+        "doc_type": doc_type,
+    }
+
+
+async def iter_all_documents() -> AsyncIterator[dict[str, Any]]:
+    """모든 문서를 커서 배치 단위로 스트리밍하는 함수"""
+    for model, doc_type in ((OpenFileInfo, "FILE"), (OpenAPIInfo, "API")):
+        cursor = model.get_pymongo_collection().find(
+            {}, _DOCUMENT_PROJECTION, batch_size=DOCUMENT_CURSOR_BATCH_SIZE
         )
-
-    for doc in api_docs:
-        processed_data.append(
-            {
-                "_id": doc.list_id,
-                "list_title": doc.list_title or "",
-                "desc": doc.desc or "",
-                "keywords": doc.keywords
-                if isinstance(doc.keywords, list)
-                else [],
-                "doc_type": "API",
-            }
-        )
-
-    return processed_data
+        async for doc in cursor:
+            yield _normalize_document(doc, doc_type)
 
 
 async def main():
     """모든 문서에 대해 추천 아이템을 생성하고 저장하는 메인 함수"""
-    settings = get_settings()
+    settings = get_infra_settings()
     await MongoDB.init(settings.MONGO_URL, settings.MONGO_DB)
 
     client = MilvusClient(uri=settings.MILVUS_URL)
     collection_name = "recommendation_db"
 
-    all_documents = await get_all_documents()
-
     successful_count = 0
     failed_count = 0
 
     print("\n=== 모든 문서에 대한 추천 생성 시작 ===")
-    print(f"총 {len(all_documents)}개 문서 처리 예정")
 
-    try:
-        for doc in tqdm(all_documents, desc="문서 추천 생성 중"):
-            doc_id = doc["_id"]
-            doc_type = doc["doc_type"]
+    # 전체 벡터를 한 번에 적재해 청크마다 query를 다시 호출하지 않고
+    # 바로 search로 넘김
+    vectors = await asyncio.to_thread(load_all_vectors, client, collection_name)
+    print(f"벡터 {len(vectors)}개 적재 완료")
+
+    semaphore = asyncio.Semaphore(RECOMMEND_CONCURRENCY)
+
+    def _search_chunk(chunk_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
+        targets = [
+            (doc_id, vectors[doc_id])
+            for doc_id in chunk_ids
+            if doc_id in vectors
+        ]
+        return dict(
+            zip(
+                (doc_id for doc_id, _ in targets),
+                search_similar_batch(client, collection_name, targets),
+            )
+        )
+
+    async def _process_chunk(chunk: list[dict[str, Any]]) -> None:
+        nonlocal successful_count, failed_count
+        chunk_ids = [str(doc["_id"]) for doc in chunk]
 
+        async with semaphore:
             try:
-                filter_expr = f'doc_id == "{str(doc_id)}"'
-                result = client.query(
-                    collection_name=collection_name,
-                    filter=filter_expr,
-                    output_fields=["vector"],
+                batch_recommendations = await asyncio.to_thread(
+                    _search_chunk, chunk_ids
                 )
-
-                if result and len(result) > 0 and result[0]["vector"]:
-                    target_embedding = np.array(result[0]["vector"])
-
-                    recommendations = recommend_similar_documents(
-                        client, collection_name, target_embedding, str(doc_id)
-                    )
-
-                    # 빈 리스트라도 저장하여 "조회 완료했지만 추천 없음" 상태 표시
-                    await store_recommendations_in_mongo(
-                        str(doc_id), doc_type, recommendations
-                    )
-                    successful_count += 1
-
-                else:
-                    # Milvus에 벡터가 없는 경우에도 빈 추천으로 저장
-                    await store_recommendations_in_mongo(
-                        str(doc_id), doc_type, []
-                    )
-                    failed_count += 1
-
             except Exception:
-                failed_count += 1
+                failed_count += len(chunk)
+                return
+
+            # 벡터가 없거나 추천이 없는 문서도 빈 리스트로 저장하여
+            # "조회 완료했지만 추천 없음" 상태 표시
+            items = [
+                (doc_id, doc["doc_type"], batch_recommendations.get(doc_id, []))
+                for doc, doc_id in zip(chunk, chunk_ids)
+            ]
+            if await store_recommendations_bulk(items):
+                successful_count += len(batch_recommendations)
+                failed_count += len(chunk) - len(batch_recommendations)
+            else:
+                failed_count += len(chunk)
+
+    progress = tqdm(desc="문서 추천 생성 중", unit="docs")
+    pending: set[asyncio.Task] = set()
+
+    def _schedule(chunk: list[dict[str, Any]]) -> None:
+        task = asyncio.create_task(_process_chunk(chunk))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        task.add_done_callback(lambda _: progress.update(len(chunk)))
+
+    try:
+        # 커서를 읽는 동안 앞선 청크의 Milvus/Mongo 작업이 함께 진행되며,
+        # 대기 중인 청크 수를 제한해 메모리를 배치 크기 수준으로 유지
+        chunk: list[dict[str, Any]] = []
+        async for doc in iter_all_documents():
+            chunk.append(doc)
+            if len(chunk) < RECOMMEND_BATCH_SIZE:
                 continue
+            _schedule(chunk)
+            chunk = []
+            if len(pending) >= RECOMMEND_CONCURRENCY * 2:
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        if chunk:
+            _schedule(chunk)
+        if pending:
+            await asyncio.gather(*pending)
+        progress.close()
 
         print("\n=== 추천 생성 완료 ===")
         print(f"성공: {successful_count}개")
@@ -0,0 +1,235 @@
+# Copyright 2025 Team Aeris
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+from pymilvus import MilvusClient
+from pymongo import UpdateOne
+
+from models import DocRecommendation
+
+RECOMMEND_BATCH_SIZE = 1000
+# Milvus query_iterator의 최대 batch_size
+VECTOR_SCAN_BATCH_SIZE = 16384
+# 유사도 점수를 소수점 4자리 정수로 저장 (BSON double 8바이트 -> int32 4바이트)
+SCORE_SCALE = 10_000
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """IP 메트릭이 코사인과 같아지도록 행 단위로 L2 정규화"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / (norms + 1e-12)
+
+
+def fetch_vectors(
+    client: MilvusClient, collection_name: str, doc_ids: list[str]
+) -> dict[str, list[float]]:
+    """doc_id 목록의 벡터를 한 번의 Milvus PK 조회로 가져옴"""
+    if not doc_ids:
+        return {}
+
+    # doc_id가 PK이므로 필터식 대신 PK 조회 사용
+    rows = client.get(
+        collection_name=collection_name,
+        ids=doc_ids,
+        output_fields=["doc_id", "vector"],
+    )
+    return {row["doc_id"]: row["vector"] for row in rows if row.get("vector")}
+
+
+def load_all_vectors(
+    client: MilvusClient,
+    collection_name: str,
+    batch_size: int = VECTOR_SCAN_BATCH_SIZE,
+) -> dict[str, np.ndarray]:
+    """컬렉션 전체 벡터를 iterator로 한 번에 읽어 메모리에 적재
+
+    메모리를 줄이기 위해 float16으로 보관하며, 검색 시 float32로 변환됨
+    """
+    vectors: dict[str, np.ndarray] = {}
+    iterator = client.query_iterator(
+        collection_name=collection_name,
+        batch_size=batch_size,
+        filter="",
+        output_fields=["doc_id", "vector"],
+    )
+    try:
+        while rows := iterator.next():
+            for row in rows:
+                if row.get("vector"):
+                    vectors[row["doc_id"]] = np.asarray(
+                        row["vector"], dtype=np.float16
+                    )
+    finally:
+        iterator.close()
+    return vectors
+
+
+def _select_recommendations(
+    hits: list[dict[str, Any]], target_doc_id: str, top_k: int
+) -> list[dict[str, Any]]:
+    recommendations = [
+        {
+            "doc_id": hit.get("doc_id"),
+            "doc_type": hit.get("doc_type", "API"),
+            "similarity_score": float(hit.get("distance", 0)),
+        }
+        for hit in hits
+        if hit.get("doc_id") != target_doc_id
+    ][:top_k]
+    for rank, rec in enumerate(recommendations, start=1):
+        rec["rank"] = rank
+    return recommendations
+
+
+def search_similar_batch(
+    client: MilvusClient,
+    collection_name: str,
+    targets: list[tuple[str, np.ndarray | list[float]]],
+    top_k: int = 4,
+    threshold: float = 0.5,
+) -> list[list[dict[str, Any]]]:
+    """여러 문서의 추천을 한 번의 Milvus 검색으로 생성"""
+    if not targets:
+        return []
+
+    # 벡터는 적재 시 정규화되어 있으므로 IP가 코사인 유사도와 같음.
+    # 임계값 이상만 반환하도록 range search로 서버에서 걸러냄.
+    # SQ 양자화로 1.0을 살짝 넘는 근접 중복이 빠지지 않도록 상한은 두지 않음
+    search_params = {
+        "metric_type": "IP",
+        "params": {"ef": 64, "radius": threshold},
+    }
+
+    results = client.search(
+        collection_name=collection_name,
+        data=np.ascontiguousarray(
+            np.stack([np.asarray(vector) for _, vector in targets]),
+            dtype=np.float32,
+        ),
+        anns_field="vector",
+        search_params=search_params,
+        limit=top_k + 1,
+        output_fields=["doc_id", "doc_type"],
+    )
+
+    return [
+        _select_recommendations(hits, target_doc_id, top_k)
+        for (target_doc_id, _), hits in zip(targets, results)
+    ]
+
+
+def search_similar(
+    client: MilvusClient,
+    collection_name: str,
+    target_embedding: np.ndarray | list[float],
+    target_doc_id: str,
+    top_k: int = 4,
+    threshold: float = 0.5,
+) -> list[dict[str, Any]]:
+    """단일 문서에 대한 유사 문서 검색"""
+    return search_similar_batch(
+        client,
+        collection_name,
+        [(target_doc_id, target_embedding)],
+        top_k,
+        threshold,
+    )[0]
+
+
+def build_recommendation_fields(
+    recommendations: list[dict[str, Any]],
+) -> dict[str, list]:
+    """추천 목록을 DocRecommendation의 병렬 배열 필드로 변환"""
+    return {
+        "doc_ids": [str(rec["doc_id"]) for rec in recommendations],
+        "doc_types": [rec.get("doc_type", "API") for rec in recommendations],
+        "scores": [
+            round(float(rec["similarity_score"]) * SCORE_SCALE)
+            for rec in recommendations
+        ],
+    }
+
+
+def recommendations_from_fields(doc: dict[str, Any]) -> list[dict[str, Any]]:
+    """병렬 배열 필드를 API 응답용 추천 목록으로 변환"""
+    return [
+        {
+            "doc_id": doc_id,
+            "doc_type": doc_type,
+            "similarity_score": score / SCORE_SCALE,
+            "rank": rank,
+        }
+        for rank, (doc_id, doc_type, score) in enumerate(
+            zip(
+                doc.get("doc_ids", []),
+                doc.get("doc_types", []),
+                doc.get("scores", []),
+            ),
+            start=1,
+        )
+    ]
+
+
+RECOMMENDATION_FIELDS = ("doc_ids", "doc_types", "scores")
+
+
+def _build_update_op(
+    target_doc_id: str,
+    target_doc_type: str,
+    recommendations: list[dict[str, Any]],
+    set_fields: dict[str, Any],
+    now: datetime,
+) -> UpdateOne:
+    return UpdateOne(
+        {"target_doc_id": target_doc_id},
+        {
+            "$set": {
+                "target_doc_type": target_doc_type,
+                **build_recommendation_fields(recommendations),
+                **set_fields,
+            },
+            "$inc": {"version": 1},
+            "$setOnInsert": {"created_at": now},
+        },
+        upsert=True,
+    )
+
+
+async def upsert_recommendations_bulk(
+    items: list[tuple[str, str, list[dict[str, Any]]]],
+    ttl_days: int | None = None,
+) -> None:
+    """여러 문서의 추천 결과를 한 번의 bulk_write로 MongoDB에 저장"""
+    if not items:
+        return
+
+    # 시각과 만료 시각은 배치 단위로 한 번만 계산
+    now = datetime.now(timezone.utc)
+    set_fields: dict[str, Any] = {"updated_at": now}
+    if ttl_days is not None:
+        set_fields["expires_at"] = now + timedelta(days=ttl_days)
+
+    operations = [
+        _build_update_op(
+            target_doc_id, target_doc_type, recommendations, set_fields, now
+        )
+        for target_doc_id, target_doc_type, recommendations in items
+    ]
+
+    await DocRecommendation.get_pymongo_collection().bulk_write(
+        operations, ordered=False
+    )
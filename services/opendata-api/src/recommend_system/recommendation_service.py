@@ -11,126 +11,150 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
 from typing import Any
 
-import numpy as np
 from pymilvus import MilvusClient
 
-from core.settings import get_settings
+from core.settings import get_infra_settings
 from models import DocRecommendation
-from models.open_data import RecommendationItem
+from recommend_system.recommend_core import (
+    RECOMMEND_BATCH_SIZE,
+    RECOMMENDATION_FIELDS,
+    fetch_vectors,
+    recommendations_from_fields,
+    search_similar_batch,
+    upsert_recommendations_bulk,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _TTLCache:
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+_recommendation_cache = _TTLCache(maxsize=10_000, ttl=300)
+
+
 class RecommendationService:
     def __init__(
         self,
         milvus_uri: str | None = None,
         collection_name: str = "recommendation_db",
+        milvus_client: MilvusClient | None = None,
     ):
-        if milvus_uri is None:
-            milvus_uri = get_settings().MILVUS_URL
-        self.milvus_client = MilvusClient(uri=milvus_uri)
+        if milvus_client is None:
+            if milvus_uri is None:
+                milvus_uri = get_infra_settings().MILVUS_URL
+            milvus_client = MilvusClient(uri=milvus_uri)
+        self.milvus_client = milvus_client
         self.collection_name = collection_name
 
-    def _create_embedding_text(self, doc: dict) -> str:
-        """문서의 핵심 필드를 결합하여 임베딩용 텍스트를 생성"""
-        title = doc.get("list_title", "")
-        desc = doc.get("desc", "")
-        keywords = " ".join(doc.get("keywords", []))
-
-        embedding_text = f"{title}. {desc}. 핵심키워드: {keywords}"
-        return embedding_text
-
     async def get_recommendations_from_cache(
         self, doc_id: str, top_k: int = 4
     ) -> list[dict[str, Any]] | None:
         """MongoDB 캐시에서 추천 결과 조회"""
         try:
-            result = await DocRecommendation.find_one(
-                DocRecommendation.target_doc_id == doc_id,
+            cached = _recommendation_cache.get(doc_id)
+            if cached is not None and cached[0] >= top_k:
+                return cached[1][:top_k]
+
+            result = await DocRecommendation.get_pymongo_collection().find_one(
+                {"target_doc_id": doc_id},
+                {
+                    "_id": 0,
+                    **{
+                        field: {"$slice": top_k}
+                        for field in RECOMMENDATION_FIELDS
+                    },
+                },
             )
 
             if result:
-                recommendations = []
-                for item in result.recommendations[:top_k]:
-                    recommendations.append(
-                        {
-                            "doc_id": item.doc_id,
-                            "doc_type": item.doc_type,
-                            "similarity_score": item.similarity_score,
-                            "rank": item.rank,
-                        }
-                    )
+                recommendations = recommendations_from_fields(result)
+                _recommendation_cache.set(doc_id, (top_k, recommendations))
 
                 logger.info(
-                    f"캐시에서 추천 조회 완료: {doc_id} -> {len(recommendations)}개"
+                    "캐시에서 추천 조회 완료: %s -> %d개",
+                    doc_id,
+                    len(recommendations),
                 )
                 return recommendations
             else:
-                logger.info(f"캐시에 추천 없음 또는 만료됨: {doc_id}")
+                logger.info("캐시에 추천 없음 또는 만료됨: %s", doc_id)
                 return None
 
         except Exception as e:
-            logger.error(f"캐시 추천 조회 실패: {e}")
+            logger.error("캐시 추천 조회 실패: %s", e)
             return None
 
+    def _search_batch(
+        self, doc_ids: list[str], top_k: int = 4, threshold: float = 0.5
+    ) -> dict[str, list[dict[str, Any]]]:
+        """여러 문서의 벡터 조회와 유사도 검색을 각각 한 번의 호출로 처리"""
+        vectors = fetch_vectors(
+            self.milvus_client, self.collection_name, doc_ids
+        )
+        for doc_id in doc_ids:
+            if doc_id not in vectors:
+                logger.warning("문서를 찾을 수 없음: %s", doc_id)
+
+        targets = [
+            (doc_id, vectors[doc_id]) for doc_id in doc_ids if doc_id in vectors
+        ]
+        results = search_similar_batch(
+            self.milvus_client, self.collection_name, targets, top_k, threshold
+        )
+        return {
+            doc_id: recommendations
+            for (doc_id, _), recommendations in zip(targets, results)
+        }
+
     def get_recommendations_realtime(
         self, doc_id: str, top_k: int = 4, threshold: float = 0.5
     ) -> list[dict[str, Any]]:
         """Milvus를 사용한 실시간 추천"""
         try:
-            target_result = self.milvus_client.query(
-                collection_name=self.collection_name,
-                filter=f'doc_id == "{doc_id}"',
-                output_fields=["vector"],
-            )
-
-            if not target_result:
-                logger.warning(f"문서를 찾을 수 없음: {doc_id}")
-                return []
-
-            target_embedding = np.array(target_result[0]["vector"])
-
-            search_params = {"metric_type": "COSINE", "params": {"nprobe": 10}}
-
-            results = self.milvus_client.search(
-                collection_name=self.collection_name,
-                data=[target_embedding.tolist()],
-                anns_field="vector",
-                search_params=search_params,
-                limit=top_k + 1,
-                output_fields=["doc_id", "doc_type"],
-            )
-
-            recommendations = []
-            for hit in results[0]:
-                hit_doc_id = hit.get("doc_id")
-                score = hit.get("distance", 0)
-
-                if hit_doc_id != doc_id and score >= threshold:
-                    recommendations.append(
-                        {
-                            "doc_id": hit_doc_id,
-                            "doc_type": hit.get("doc_type", "API"),
-                            "similarity_score": float(score),
-                            "rank": len(recommendations) + 1,
-                        }
-                    )
-
-                    if len(recommendations) >= top_k:
-                        break
+            recommendations = self._search_batch(
+                [doc_id], top_k, threshold
+            ).get(doc_id, [])
 
             logger.info(
-                f"실시간 추천 완료: {doc_id} -> {len(recommendations)}개"
+                "실시간 추천 완료: %s -> %d개", doc_id, len(recommendations)
             )
             return recommendations
 
         except Exception as e:
-            logger.error(f"실시간 추천 실패: {e}")
+            logger.error("실시간 추천 실패: %s", e)
             return []
 
     async def store_recommendations(
@@ -142,47 +166,33 @@ class RecommendationService:
     ):
         """추천 결과를 MongoDB에 저장"""
         try:
-            recommendation_items = []
-            for i, rec in enumerate(recommendations):
-                item = RecommendationItem(
-                    doc_id=rec["doc_id"],
-                    doc_type=rec.get("doc_type", "API"),
-                    similarity_score=rec["similarity_score"],
-                    rank=rec.get("rank", i + 1),
-                )
-                recommendation_items.append(item)
-
-            existing_rec = await DocRecommendation.find_one(
-                DocRecommendation.target_doc_id == doc_id
+            await upsert_recommendations_bulk(
+                [(doc_id, target_doc_type, recommendations)], ttl_days=ttl_days
+            )
+            _recommendation_cache.pop(doc_id)
+            logger.info(
+                "추천 결과 저장 완료: %s -> %d개", doc_id, len(recommendations)
             )
 
-            now = datetime.utcnow()
-            expires_at = now + timedelta(days=ttl_days)
+        except Exception as e:
+            logger.error("추천 결과 저장 실패: %s", e)
 
-            if existing_rec:
-                existing_rec.recommendations = recommendation_items
-                existing_rec.updated_at = now
-                existing_rec.expires_at = expires_at
-                existing_rec.version += 1
-                await existing_rec.save()
-                logger.info(f"추천 결과 업데이트 완료: {doc_id}")
-            else:
-                new_rec = DocRecommendation(
-                    target_doc_id=doc_id,
-                    target_doc_type=target_doc_type,
-                    recommendations=recommendation_items,
-                    created_at=now,
-                    updated_at=now,
-                    expires_at=expires_at,
-                    version=1,
-                )
-                await new_rec.save()
-                logger.info(
-                    f"추천 결과 저장 완료: {doc_id} -> {len(recommendations)}개"
-                )
+    async def store_recommendations_bulk(
+        self,
+        items: list[tuple[str, str, list[dict[str, Any]]]],
+        ttl_days: int = 7,
+    ) -> bool:
+        """여러 문서의 추천 결과를 한 번의 bulk_write로 MongoDB에 저장"""
+        try:
+            await upsert_recommendations_bulk(items, ttl_days=ttl_days)
+            for doc_id, _, _ in items:
+                _recommendation_cache.pop(doc_id)
+            logger.info("추천 결과 일괄 저장 완료: %d개", len(items))
+            return True
 
         except Exception as e:
-            logger.error(f"추천 결과 저장 실패: {e}")
+            logger.error("추천 결과 일괄 저장 실패: %s", e)
+            return False
 
     async def get_recommendations(
         self,
@@ -200,8 +210,8 @@ class RecommendationService:
                 if cached_recommendations:
                     return cached_recommendations
 
-            realtime_recommendations = self.get_recommendations_realtime(
-                doc_id, top_k
+            realtime_recommendations = await asyncio.to_thread(
+                self.get_recommendations_realtime, doc_id, top_k
             )
             if realtime_recommendations:
                 await self.store_recommendations(
@@ -211,31 +221,35 @@ class RecommendationService:
             return realtime_recommendations
 
         except Exception as e:
-            logger.error(f"추천 조회 실패: {e}")
+            logger.error("추천 조회 실패: %s", e)
             return []
 
     async def batch_generate_recommendations(
         self, doc_ids: list[str], target_doc_type: str = "API", top_k: int = 4
     ):
         """배치로 추천 생성 및 저장"""
-        logger.info(f"배치 추천 생성 시작: {len(doc_ids)}개 문서")
+        logger.info("배치 추천 생성 시작: %d개 문서", len(doc_ids))
 
         success_count = 0
-        for doc_id in doc_ids:
+        for start in range(0, len(doc_ids), RECOMMEND_BATCH_SIZE):
+            chunk = doc_ids[start : start + RECOMMEND_BATCH_SIZE]
             try:
-                recommendations = self.get_recommendations_realtime(
-                    doc_id, top_k
+                batch_recommendations = await asyncio.to_thread(
+                    self._search_batch, chunk, top_k
                 )
-                if recommendations:
-                    await self.store_recommendations(
-                        doc_id, target_doc_type, recommendations
-                    )
-                    success_count += 1
-
             except Exception as e:
-                logger.error(f"문서 {doc_id} 추천 생성 실패: {e}")
+                logger.error("배치 추천 검색 실패: %s", e)
+                continue
+
+            items = [
+                (doc_id, target_doc_type, recommendations)
+                for doc_id, recommendations in batch_recommendations.items()
+                if recommendations
+            ]
+            if await self.store_recommendations_bulk(items):
+                success_count += len(items)
 
         logger.info(
-            f"배치 추천 생성 완료: {success_count}/{len(doc_ids)}개 성공"
+            "배치 추천 생성 완료: %d/%d개 성공", success_count, len(doc_ids)
         )
         return success_count
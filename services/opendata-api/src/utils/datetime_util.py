@@ -37,6 +37,4 @@ def kst_to_utc(kst_dt: datetime) -> datetime:
 
 def format_datetime(dt: datetime | None) -> str | None:
     """datetime을 ISO 형식 문자열로 변환"""
-    if dt is None:
-        return None
-    return dt.isoformat()
+    return dt.isoformat() if dt is not None else None
@@ -11,17 +11,85 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import json
 import logging
+import os
+import queue
 import sys
 import threading
 import time
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
+import orjson
 from loguru import logger as loguru_logger
 
 
+class _LogWriterThread(threading.Thread):
+    """모든 StreamingFileHandler가 공유하는 단일 파일 쓰기 스레드"""
+
+    batch_size = 1000
+    max_delay = 0.05
+
+    def __init__(self):
+        super().__init__(name="log-writer", daemon=True)
+        # (핸들러, 로그 bytes 또는 flush 완료 Event, 즉시 기록 여부)
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    def run(self):
+        while True:
+            batches: dict[StreamingFileHandler, list[bytes]] = {}
+            waiters: list[threading.Event] = []
+
+            item = self.queue.get()
+            urgent = self._collect(item, batches, waiters)
+            deadline = time.monotonic() + self.max_delay
+            count = 1
+            while count < self.batch_size:
+                # 에러 로그나 flush 요청이 있으면 이미 쌓인 것만 모아 바로 기록
+                timeout = 0 if urgent else deadline - time.monotonic()
+                try:
+                    if timeout > 0:
+                        item = self.queue.get(timeout=timeout)
+                    else:
+                        item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                urgent = self._collect(item, batches, waiters) or urgent
+                count += 1
+
+            for handler, entries in batches.items():
+                handler._write_entries(entries)
+            for waiter in waiters:
+                waiter.set()
+
+    def _collect(
+        self,
+        item: tuple,
+        batches: dict,
+        waiters: list[threading.Event],
+    ) -> bool:
+        handler, payload, urgent = item
+        if isinstance(payload, threading.Event):
+            waiters.append(payload)
+        else:
+            batches.setdefault(handler, []).append(payload)
+        return urgent
+
+
+_writer: _LogWriterThread | None = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> _LogWriterThread:
+    global _writer
+
+    with _writer_lock:
+        if _writer is None:
+            _writer = _LogWriterThread()
+            _writer.start()
+        return _writer
+
+
 class StreamingFileHandler(logging.Handler):
     def __init__(
         self,
@@ -29,49 +97,63 @@ class StreamingFileHandler(logging.Handler):
         max_file_size: int = 10 * 1024 * 1024,
         backup_count: int = 5,
         service_name: str = "",
-        flush_interval: float = 1.0,
     ):
         super().__init__()
         self.log_dir = Path(log_dir)
         self.max_file_size = max_file_size
         self.backup_count = backup_count
         self.service_name = service_name
-        self.flush_interval = flush_interval
 
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
+        self._current_day: date | None = None
+        self._cached_path: Path | None = None
         self.current_file = self._get_log_file_path()
         self.file_handler = None
         self._open_file()
 
-        self.buffer = []
-        self.buffer_lock = threading.Lock()
+        # 같은 초의 로그는 포맷된 시각을 재사용 (초, 문자열)
+        self._timestamp_cache: tuple[int, str] = (-1, "")
+        self._exc_formatter = logging.Formatter()
 
-        self.flush_thread = threading.Thread(
-            target=self._flush_worker, daemon=True
-        )
-        self.flush_thread.start()
+        self._writer = _get_writer()
 
     def _get_log_file_path(self) -> Path:
-        timestamp = datetime.now().strftime("%Y%m%d")
+        # 날짜가 바뀔 때만 파일명을 다시 만든다
+        today = date.today()
+        if today == self._current_day and self._cached_path is not None:
+            return self._cached_path
+
+        timestamp = today.strftime("%Y%m%d")
         if self.service_name:
             filename = f"{self.service_name}_{timestamp}.log"
         else:
             filename = f"app_{timestamp}.log"
-        return self.log_dir / filename
+        self._current_day = today
+        self._cached_path = self.log_dir / filename
+        return self._cached_path
 
     def _open_file(self):
         if self.file_handler:
             self.file_handler.close()
 
-        self.file_handler = open(self.current_file, "a", encoding="utf-8")
+        # 버퍼링 없이 열어 flush마다 os.write 한 번으로 기록
+        self.file_handler = open(self.current_file, "ab", buffering=0)
+        self._bytes_written = os.fstat(self.file_handler.fileno()).st_size
 
     def _rotate_file(self):
-        if not self.current_file.exists():
+        # 자정이 지나면 새 날짜 파일로 전환
+        if date.today() != self._current_day:
+            self.current_file = self._get_log_file_path()
+            self._open_file()
             return
 
-        file_size = self.current_file.stat().st_size
-        if file_size >= self.max_file_size:
+        # 파일 크기는 stat 대신 기록한 바이트 수로 추적
+        if self._bytes_written >= self.max_file_size:
+            if not self.current_file.exists():
+                self._open_file()
+                return
+
             for i in range(self.backup_count - 1, 0, -1):
                 old_file = self.current_file.with_suffix(f".{i}")
                 new_file = self.current_file.with_suffix(f".{i + 1}")
@@ -88,24 +170,12 @@ class StreamingFileHandler(logging.Handler):
             self.current_file = self._get_log_file_path()
             self._open_file()
 
-    def _flush_worker(self):
-        while True:
-            time.sleep(self.flush_interval)
-            self._flush_buffer()
-
-    def _flush_buffer(self):
-        with self.buffer_lock:
-            if not self.buffer:
-                return
-
-            logs_to_write = self.buffer.copy()
-            self.buffer.clear()
-
+    def _write_entries(self, entries: list[bytes]):
         try:
-            for log_entry in logs_to_write:
-                if self.file_handler:
-                    self.file_handler.write(log_entry + "\n")
-                    self.file_handler.flush()
+            if self.file_handler:
+                payload = b"\n".join(entries) + b"\n"
+                os.write(self.file_handler.fileno(), payload)
+                self._bytes_written += len(payload)
 
             self._rotate_file()
 
@@ -114,10 +184,17 @@ class StreamingFileHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord):
         try:
+            second = int(record.created)
+            cached = self._timestamp_cache
+            if cached[0] != second:
+                cached = (
+                    second,
+                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)),
+                )
+                self._timestamp_cache = cached
+
             structured_log = {
-                "timestamp": datetime.fromtimestamp(record.created).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
+                "timestamp": cached[1],
                 "level": record.levelname,
                 "logger": record.name,
                 "message": record.getMessage(),
@@ -128,26 +205,29 @@ class StreamingFileHandler(logging.Handler):
             }
 
             if record.exc_info:
-                formatter = logging.Formatter()
-                structured_log["exception"] = formatter.formatException(
-                    record.exc_info
+                structured_log["exception"] = (
+                    self._exc_formatter.formatException(record.exc_info)
                 )
 
-            with self.buffer_lock:
-                self.buffer.append(
-                    json.dumps(structured_log, ensure_ascii=False)
+            self._writer.queue.put(
+                (
+                    self,
+                    orjson.dumps(structured_log),
+                    record.levelno >= logging.ERROR,
                 )
-
-            if record.levelno >= logging.ERROR:
-                self._flush_buffer()
+            )
 
         except Exception as e:
             print(f"로그 처리 실패: {e}")
 
     def close(self):
-        self._flush_buffer()
+        # 쓰기 스레드가 앞서 들어온 로그를 모두 기록할 때까지 대기
+        flushed = threading.Event()
+        self._writer.queue.put((self, flushed, True))
+        flushed.wait(timeout=5)
         if self.file_handler:
             self.file_handler.close()
+            self.file_handler = None
         super().close()
 
 